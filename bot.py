@@ -230,6 +230,16 @@ class Bot(DCBot):
         # Log startup complete
         logger.info("Bot is fully ready")
 
+    async def close(self):
+        """Flush buffered monitoring status before shutting down"""
+        try:
+            from utils.monitoring_status import shutdown as shutdown_monitoring_status
+            await shutdown_monitoring_status(self)
+        except Exception as e:
+            logger.error(f"Error shutting down monitoring status: {e}")
+
+        await super().close()
+
 async def main():
     """Main entry point"""
     try:
@@ -25,6 +25,7 @@ from utils.command_handlers import command_handler, db_operation
 from utils.safe_mongodb import SafeMongoDBResult, SafeDocument
 from utils.discord_utils import get_guild_document, server_id_autocomplete
 from utils.interaction_handlers import safely_respond_to_interaction, defer_interaction
+from utils.model_cache import invalidate_guild
 
 logger = logging.getLogger(__name__)
 
@@ -413,6 +414,7 @@ class GuildSettings(commands.Cog):
                 init_data,
                 upsert=True
             )
+            invalidate_guild(guild_id_str)
             
             # Return success
             return SafeMongoDBResult.ok({
@@ -516,6 +518,7 @@ class GuildSettings(commands.Cog):
                 update_data,
                 upsert=True
             )
+            invalidate_guild(guild_id_str)
             
             # Return success
             return SafeMongoDBResult.ok({
@@ -572,6 +575,7 @@ class GuildSettings(commands.Cog):
                 update_data,
                 upsert=True
             )
+            invalidate_guild(guild_id_str)
             
             # Return success
             return SafeMongoDBResult.ok({
@@ -620,6 +624,7 @@ class GuildSettings(commands.Cog):
                 {"guild_id": guild_id_str},
                 update_data
             )
+            invalidate_guild(guild_id_str)
             
             # Return success
             return SafeMongoDBResult.ok({
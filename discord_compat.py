@@ -8,13 +8,17 @@ It should be imported before any other discord modules.
 import sys
 import importlib
 import logging
-import os
+import site
 from pathlib import Path
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cached location of py_cord/__init__.py (None when not installed)
+_UNSET = object()
+_PYCORD_PATH = _UNSET
+
 def find_module_path(name):
     """Find the path to a module"""
     try:
@@ -25,6 +29,37 @@ def find_module_path(name):
     except (ImportError, AttributeError):
         return None
 
+def _candidate_dirs():
+    """Yield directories that may contain a py_cord package, most likely first"""
+    try:
+        yield from site.getsitepackages()
+    except AttributeError:
+        # getsitepackages is unavailable inside some virtualenvs
+        pass
+    user_site = getattr(site, "USER_SITE", None)
+    if user_site:
+        yield user_site
+    # Replit specific paths
+    yield "__pythonlibs__/lib/python3.11/site-packages"
+    yield "/home/runner/workspace/.pythonlibs/lib/python3.11/site-packages"
+    yield "/home/runner/.pythonlibs/lib/python3.11/site-packages"
+    # Local installation
+    yield "."
+
+def find_py_cord_path():
+    """Find py_cord/__init__.py, caching the result for later calls"""
+    global _PYCORD_PATH
+    if _PYCORD_PATH is not _UNSET:
+        return _PYCORD_PATH
+    
+    _PYCORD_PATH = None
+    for directory in _candidate_dirs():
+        candidate = Path(directory) / "py_cord" / "__init__.py"
+        if candidate.is_file():
+            _PYCORD_PATH = candidate
+            break
+    return _PYCORD_PATH
+
 def ensure_py_cord():
     """Ensure py-cord is being used for discord imports"""
     discord_path = find_module_path("discord")
@@ -39,34 +74,19 @@ def ensure_py_cord():
         
     # Try to perform a compatibility fix by finding py-cord installation
     try:
-        # Look in the current directory structure
-        potential_paths = [
-            # Standard pip install 
-            Path("__pythonlibs__/lib/python3.11/site-packages/py_cord"),
-            # Replit specific paths
-            Path("/home/runner/workspace/.pythonlibs/lib/python3.11/site-packages/py_cord"),
-            Path("/home/runner/.pythonlibs/lib/python3.11/site-packages/py_cord"),
-            # Local installation
-            Path("py_cord"),
-        ]
-        
-        for potential_path in potential_paths:
-            if potential_path.exists() and potential_path.is_dir():
-                logger.info(f"Found py-cord at: {potential_path}")
-                
-                # Add this module to sys.modules as discord
-                if "__init__.py" in os.listdir(potential_path):
-                    logger.info("Setting py-cord as the discord module")
-                    
-                    # Create module spec and load it
-                    spec = importlib.util.spec_from_file_location("py_cord", 
-                                                                potential_path / "__init__.py")
-                    py_cord = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(py_cord)
-                    
-                    # Replace discord in sys.modules
-                    sys.modules["discord"] = py_cord
-                    return True
+        py_cord_path = find_py_cord_path()
+        if py_cord_path is not None:
+            logger.info(f"Found py-cord at: {py_cord_path.parent}")
+            logger.info("Setting py-cord as the discord module")
+            
+            # Create module spec and load it
+            spec = importlib.util.spec_from_file_location("py_cord", py_cord_path)
+            py_cord = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(py_cord)
+            
+            # Replace discord in sys.modules
+            sys.modules["discord"] = py_cord
+            return True
         
         logger.warning("Could not find py-cord installation")
     except Exception as e:
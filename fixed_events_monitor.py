@@ -1,6 +1,15 @@
     async def start_events_monitor(self, guild_id: int, server_id: str):
         """Background task to monitor events for a server"""
+        import random
         from config import EVENTS_REFRESH_INTERVAL
+        from utils.model_cache import get_cached, load_monitor_context
+        from utils.monitoring_status import flush_status, queue_status, utcnow
+        from utils.sftp_pool import get_sftp_pool
+        from utils.server_identity import resolve_original_server_id
+        from utils.event_classifier import classify_entries, split_log_entries
+    
+        # Filter for this monitor's status document, shared by every update below
+        monitoring_filter = {"guild_id": guild_id, "server_id": server_id, "type": "events"}
     
         try:
             # Initialize reconnection tracking
@@ -9,12 +18,6 @@
             backoff_time = 5  # Start with 5 seconds
             last_successful_connection = time.time()
 
-            # Check if we actually have server data in the database
-            # This prevents errors when the bot starts up with empty database
-            if await self.bot.db.guilds.count_documents({"guild_id": guild_id, "servers": {"$exists": True, "$ne": []}}) == 0:
-                logger.warning(f"No servers found for guild {guild_id} - skipping events monitor")
-                return
-
             # Check if guild exists in bot's cache
             discord_guild = self.bot.get_guild(int(guild_id))
             if discord_guild is None:
@@ -22,12 +25,14 @@
             # Don't return here, we'll still process data for when the guild is available later
 
             logger.info(f"Starting events monitor for server {server_id} in guild {guild_id}")
-            # Get server data
+            # Get guild, server and monitoring data in a single round trip
+            # This also prevents errors when the bot starts up with empty database
             try:
-                server = await Server.get_by_id(self.bot.db, server_id, str(guild_id))
-                if server is None:
-                    logger.error(f"Server {server_id} not found in guild {guild_id}")
+                context = await load_monitor_context(self.bot.db, guild_id, server_id, "events")
+                if context is None:
+                    logger.warning(f"Server {server_id} not found in guild {guild_id} - skipping events monitor")
                     return
+                server, guild_model, monitoring_doc = context
                     
                 # Verify channel configuration
                 events_channel_id = server.events_channel_id
@@ -41,7 +46,6 @@
 
                 # Send a direct message to administrators about missing configuration
                 try:
-                    guild_model = await Guild.get_by_id(self.bot.db, guild_id)
                     if guild_model is not None and guild_model.admin_role_id:
                         # Try to get admin role
                         guild = self.bot.get_guild(guild_id)
@@ -57,84 +61,39 @@
                 channel_configured = False
                 
             # Set up SFTP client
-            # We need to connect to SFTP to get logs with event data
+            # We need to connect to SFTP to get logs with event data.
+            # Clients are shared with the other monitors of this server through the pool
+            sftp_pool = get_sftp_pool(self.bot)
             
-            sftp_key = f"{guild_id}_{server_id}_events"
-            sftp_connected = None  # Track whether we are connected or not
+            # Get the original server ID for path construction
+            original_server_id = resolve_original_server_id(server, server_id)
+            logger.debug("Using original_server_id: %s for path construction", original_server_id)
             
-            # Check if we already have a connection in the bot's connection pool
-            if hasattr(self.bot, 'sftp_connections') and sftp_key in self.bot.sftp_connections:
-                sftp_client = self.bot.sftp_connections[sftp_key]
-                # Check if still connected (does not guarantee a working connection)
-                if sftp_client.is_connected():
-                    sftp_connected = True
-                    logger.info(f"Reusing existing SFTP connection for server {server_id}")
+            from utils.sftp import SFTPClient
             
-            # If not connected, create new connection
-            if not hasattr(self.bot, 'sftp_connections'):
-                self.bot.sftp_connections = {}
-                
-            if sftp_key not in self.bot.sftp_connections or not sftp_connected:
-                # Construct path to log file based on server ID for this provider
-                path_prefix = None
-                
-                # Get the original server ID for path construction
-                original_server_id = server_id
-                
-                # First try to get from original_server_id attribute if it exists
-                if hasattr(server, 'original_server_id') and server.original_server_id:
-                    original_server_id = server.original_server_id
-                # Then try dictionary-style access if supported
-                elif hasattr(server, 'get') and callable(server.get) and server.get('original_server_id'):
-                    original_server_id = server.get('original_server_id')
-                # Then try server_data if it exists
-                elif hasattr(server, 'server_data') and isinstance(server.server_data, dict) and 'original_server_id' in server.server_data:
-                    original_server_id = server.server_data['original_server_id']
-                # If still not found but we have a numeric ID, use that
-                elif server_id.isdigit():
-                    logger.info(f"Using numeric server ID for path construction: {server_id}")
-                    original_server_id = server_id
-                else:
-                    logger.info(f"Checking for numeric server ID in server properties")
-                    
-                    # Try to find a numeric ID in server name or other properties
-                    server_name = getattr(server, 'server_name', '') if hasattr(server, 'server_name') else ''
-                    if server_name:
-                        # Try to extract a numeric ID from the server name
-                        for word in str(server_name).split():
-                            if word.isdigit() and len(word) >= 4:
-                                logger.info(f"Found potential numeric server ID in server_name: {word}")
-                                original_server_id = word
-                                break
-            
-                logger.info(f"Using original_server_id: {original_server_id} for path construction")
-                
-                # Create SFTP client
-                from utils.sftp_client import DayzServerSFTPClient
-                sftp_client = DayzServerSFTPClient(
+            async def create_sftp_client():
+                """Create and connect a new SFTP client for this server"""
+                sftp_client = SFTPClient(
+                    hostname=server.sftp_host,
+                    port=server.sftp_port,
+                    username=server.sftp_username,
+                    password=server.sftp_password,
                     server_id=server_id,
-                    server=server,
-                    path_prefix=path_prefix,
-                    provider="default",  # or check server.provider if available
                     original_server_id=original_server_id
                 )
-                
-                # Connect to SFTP server
-                try:
-                    sftp_connected = await sftp_client.connect()
-                    if not sftp_connected:
-                        logger.error(f"Failed to connect to SFTP for server {server_id}")
-                        # We'll try to reconnect later, don't return here
-                except Exception as e:
-                    logger.error(f"Error connecting to SFTP for server {server_id}: {e}")
-                    sftp_connected = None
-                
-                # Store client for later use, even if connected is None
-                self.bot.sftp_connections[sftp_key] = sftp_client
-
-            # If not connected, we'll log it and try to reconnect periodically
-            if sftp_connected is None:
-                logger.warning(f"Not connected to SFTP for server {server_id}, will attempt periodic reconnection")
+                # connect() returns the client itself; success is reported by is_connected
+                await sftp_client.connect()
+                if not sftp_client.is_connected:
+                    raise ConnectionError(f"Failed to connect to SFTP for server {server_id}: {sftp_client.last_error}")
+                return sftp_client
+            
+            # Warm the pool so connection problems are reported at startup
+            try:
+                async with sftp_pool.acquire(guild_id, server_id, create_sftp_client):
+                    pass
+            except Exception as e:
+                # If not connected, we'll log it and try to reconnect periodically
+                logger.warning(f"Not connected to SFTP for server {server_id} ({e}), will attempt periodic reconnection")
 
             # Get channels
             guild = self.bot.get_guild(guild_id)
@@ -148,8 +107,16 @@
             connections_channel = None
 
             # Log channel ID details for diagnosis
-            logger.info(f"Retrieved events_channel_id: {events_channel_id} (type: {type(events_channel_id).__name__})")
-            logger.info(f"Retrieved connections_channel_id: {connections_channel_id} (type: {type(connections_channel_id).__name__} if connections_channel_id is not None else None)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Retrieved events_channel_id: %s (type: %s)", events_channel_id, type(events_channel_id).__name__)
+                logger.debug("Retrieved connections_channel_id: %s (type: %s)", connections_channel_id, type(connections_channel_id).__name__)
+
+            # Channels recently confirmed missing (channel_id -> retry-after time),
+            # so monitor restarts don't repeat the HTTP fetch for deleted channels
+            CHANNEL_MISS_TTL = 300
+            if not hasattr(self.bot, '_channel_miss_cache'):
+                self.bot._channel_miss_cache = {}
+            channel_miss_cache = self.bot._channel_miss_cache
 
             # Only try to get channels if guild is not None exists
             if guild is not None:
@@ -159,20 +126,25 @@
                         # Ensure channel ID is an integer
                         if not isinstance(events_channel_id, int):
                             events_channel_id = int(events_channel_id)
-                            logger.info(f"Converted events_channel_id to int: {events_channel_id}")
+                            logger.debug("Converted events_channel_id to int: %s", events_channel_id)
 
                         # Try to get the channel
                         events_channel = guild.get_channel(events_channel_id)
-                        logger.info(f"Attempted to get events channel: {events_channel_id}, result: {events_channel is not None}")
+                        logger.debug("Attempted to get events channel: %s, result: %s", events_channel_id, events_channel is not None)
 
-                        if events_channel is None:
+                        if events_channel is None and time.time() < channel_miss_cache.get(events_channel_id, 0):
+                            # Recently confirmed missing, skip the HTTP fetch
+                            logger.info(f"Events channel {events_channel_id} recently not found, skipping HTTP fetch")
+                            channel_configured = False
+                        elif events_channel is None:
                             try:
                                 # Try to fetch channel through HTTP API in case it's not in cache
-                                logger.info(f"Events channel not in cache, trying HTTP fetch for: {events_channel_id}")
+                                logger.debug("Events channel not in cache, trying HTTP fetch for: %s", events_channel_id)
                                 events_channel = await guild.fetch_channel(events_channel_id)
-                                logger.info(f"HTTP fetch successful for events channel: {events_channel.name if events_channel is not None else None}")
+                                logger.debug("HTTP fetch successful for events channel: %s", events_channel)
                             except discord.NotFound:
                                 logger.error(f"Events channel {events_channel_id} not found in guild {guild_id}")
+                                channel_miss_cache[events_channel_id] = time.time() + CHANNEL_MISS_TTL
                                 channel_configured = False
                                 logger.info(f"Channel not found, continuing without events channel for server {server_id}")
                     except Exception as fetch_e:
@@ -189,20 +161,24 @@
                         # Ensure channel ID is an integer
                         if not isinstance(connections_channel_id, int):
                             connections_channel_id = int(connections_channel_id)
-                            logger.info(f"Converted connections_channel_id to int: {connections_channel_id}")
+                            logger.debug("Converted connections_channel_id to int: %s", connections_channel_id)
                         
                         # Try to get the channel
                         connections_channel = guild.get_channel(connections_channel_id)
-                        logger.info(f"Attempted to get connections channel: {connections_channel_id}, result: {connections_channel is not None}")
+                        logger.debug("Attempted to get connections channel: %s, result: %s", connections_channel_id, connections_channel is not None)
                         
-                        if connections_channel is None:
+                        if connections_channel is None and time.time() < channel_miss_cache.get(connections_channel_id, 0):
+                            # Recently confirmed missing, skip the HTTP fetch
+                            logger.info(f"Connections channel {connections_channel_id} recently not found, skipping HTTP fetch")
+                        elif connections_channel is None:
                             try:
                                 # Try to fetch channel through HTTP API in case it's not in cache
-                                logger.info(f"Connections channel not in cache, trying HTTP fetch for: {connections_channel_id}")
+                                logger.debug("Connections channel not in cache, trying HTTP fetch for: %s", connections_channel_id)
                                 connections_channel = await guild.fetch_channel(connections_channel_id)
-                                logger.info(f"HTTP fetch successful for connections channel: {connections_channel.name}")
+                                logger.debug("HTTP fetch successful for connections channel: %s", connections_channel)
                             except discord.NotFound:
                                 logger.error(f"Connections channel {connections_channel_id} not found in guild {guild_id}")
+                                channel_miss_cache[connections_channel_id] = time.time() + CHANNEL_MISS_TTL
                                 logger.info(f"Connection channel not found, continuing without connections channel for server {server_id}")
                                 # We'll still have events channel potentially
                             except Exception as fetch_e:
@@ -212,8 +188,8 @@
                         logger.error(f"Error converting connections_channel_id to int: {e}")
             
             # Log what channels we have
-            logger.info(f"Events channel: {events_channel.name if events_channel else None}")
-            logger.info(f"Connections channel: {connections_channel.name if connections_channel else None}")
+            logger.info("Events monitor channels for server %s: events=%s, connections=%s",
+                        server_id, events_channel, connections_channel)
             
             # Verify permissions if channels are found
             for channel_type, channel in [("Events", events_channel), ("Connections", connections_channel)]:
@@ -236,14 +212,44 @@
                         logger.warning(f"{channel_type} channel configured but not found: {events_channel_id}")
                         channel_configured = False
             
+            # With no channel to post to and no voice notifications, processing the
+            # log produces no output; only keep the heartbeat until that changes
+            processing_enabled = (
+                channel_configured
+                or connections_channel is not None
+                or getattr(server, 'voice_notifications_enabled', False)
+            )
+            if not processing_enabled:
+                logger.warning(f"No output channels for server {server_id}, events monitor will idle until configured")
+            idle_cycles = 0
+            
+            def build_handlers():
+                """Build the notification handlers for this server's current configuration"""
+                event_target = events_channel if channel_configured else None
+                handlers = {
+                    'event': lambda payload: process_event(self.bot, server, payload, event_target),
+                    # Process connections (player joins/leaves)
+                    'connection': lambda payload: process_connection(self.bot, server, payload, connections_channel),
+                }
+                # This is custom handling for voice communications events
+                # Only enable if server supports it
+                if getattr(server, 'voice_notifications_enabled', False):
+                    handlers['voice'] = lambda payload: process_voice_call(
+                        self.bot, server, payload['message'], payload['timestamp'], events_channel
+                    )
+                return handlers
+            
+            # Specialize once per configuration instead of re-checking features per entry
+            handlers = build_handlers()
+            
             # Initialize monitoring status in database
             try:
                 # Mark as running in database
                 await self.bot.db.monitoring.update_one(
-                    {"guild_id": guild_id, "server_id": server_id, "type": "events"},
+                    monitoring_filter,
                     {"$set": {
                         "running": True,
-                        "last_updated": datetime.datetime.utcnow(),
+                        "last_updated": utcnow(),
                         "channel_id": events_channel_id,
                         "error": None
                     }},
@@ -253,125 +259,146 @@
                 logger.error(f"Error updating monitoring status in database: {db_e}")
                 # Continue anyway
 
+            # Resume reading the log where the previous monitor stopped
+            log_offset = monitoring_doc.get("last_log_offset", 0)
+            log_head_sig = monitoring_doc.get("log_head_sig")
+            saved_position = (log_offset, log_head_sig)
+            # Remote log path, resolved on first use and again after a failed read
+            log_path = None
+            # Set when an idle monitor resumes, so the lines logged while it was
+            # idle are skipped instead of being posted all at once
+            skip_backlog = False
+            
             # Main monitoring loop
             while True:
                 try:
-                    # Get log file
-                    log_file = await sftp_client.get_log_file()
+                    if not processing_enabled:
+                        queue_status(self.bot, guild_id, server_id, "events", {})
+                        await asyncio.sleep(EVENTS_REFRESH_INTERVAL * 4)
+                        
+                        # Re-check the (cached) configuration every few idle cycles
+                        idle_cycles += 1
+                        if idle_cycles % 5 == 0:
+                            server = await get_cached(
+                                ("server", str(guild_id), str(server_id)), 60,
+                                lambda: Server.get_by_id(self.bot.db, server_id, str(guild_id))
+                            ) or server
+                            if guild is not None:
+                                if server.events_channel_id is not None:
+                                    events_channel = guild.get_channel(int(server.events_channel_id))
+                                    channel_configured = events_channel is not None
+                                if server.connections_channel_id is not None:
+                                    connections_channel = guild.get_channel(int(server.connections_channel_id))
+                            processing_enabled = (
+                                channel_configured
+                                or connections_channel is not None
+                                or getattr(server, 'voice_notifications_enabled', False)
+                            )
+                            if processing_enabled:
+                                logger.info(f"Output channels configured for server {server_id}, resuming events processing")
+                                handlers = build_handlers()
+                                skip_backlog = True
+                        continue
+                    
+                    # Get log file using a pooled client
+                    async with sftp_pool.acquire(guild_id, server_id, create_sftp_client) as sftp_client:
+                        # Only fetch the lines appended since the last poll
+                        if log_path is None:
+                            log_path = await sftp_client.get_log_file()
+                        if log_path is not None and skip_backlog:
+                            # Continue from the current end of the log
+                            log_size = await sftp_client.get_file_size(log_path)
+                            if log_size is not None:
+                                log_offset, log_head_sig = log_size, None
+                                skip_backlog = False
+                        if log_path is None:
+                            result = None
+                        else:
+                            result = await sftp_client.read_since(log_path, log_offset, log_head_sig)
+                        if result is None:
+                            log_path = None
+                            log_file = None
+                        else:
+                            chunk, log_offset, log_head_sig = result
+                            log_file = split_log_entries(chunk.decode('utf-8', errors='replace'))
+                        if log_file is None:
+                            logger.warning(f"No log file found for server {server_id}")
+                            # If we haven't found a log file for a while, try reconnecting
+                            stale = time.time() - last_successful_connection > 300  # 5 minutes
+                            # Clients without ping fall through to the full reconnect
+                            ping = getattr(sftp_client, 'ping', None)
+                            if stale and ping is not None and await ping():
+                                # A live session just has no log yet; skip the full reconnect
+                                last_successful_connection = time.time()
+                            elif stale:
+                                logger.info(f"No log file found for 5 minutes, reconnecting SFTP for server {server_id}")
+                                await sftp_client.disconnect()
+
+                                reconnect_attempts += 1
+                                if reconnect_attempts > max_reconnect_attempts:
+                                    logger.error(f"Maximum reconnection attempts ({max_reconnect_attempts}) reached for server {server_id}")
+                                    break
+
+                                # Exponential backoff with jitter so monitors don't reconnect in lock-step
+                                backoff_time = min(backoff_time * 2, 60)  # Max 60 seconds
+                                delay = random.uniform(backoff_time * 0.5, backoff_time * 1.5)
+                                logger.info(f"Waiting {delay:.1f} seconds before reconnecting (attempt {reconnect_attempts}/{max_reconnect_attempts})")
+                                await asyncio.sleep(delay)
+
+                                try:
+                                    logger.info(f"Attempting to reconnect SFTP for server {server_id}")
+                                    await sftp_client.connect()
+                                    if sftp_client.is_connected:
+                                        logger.info(f"Successfully reconnected SFTP for server {server_id}")
+                                        # Reset backoff and reconnect attempts on successful connection
+                                        backoff_time = 5
+                                        reconnect_attempts = 0
+                                        last_successful_connection = time.time()
+                                    else:
+                                        logger.error(f"Failed to reconnect SFTP for server {server_id}")
+                                except Exception as reconnect_e:
+                                    logger.error(f"Error reconnecting SFTP for server {server_id}: {reconnect_e}")
+
                     if log_file is None:
-                        logger.warning(f"No log file found for server {server_id}")
-                        # If we haven't found a log file for a while, try reconnecting
-                        if time.time() - last_successful_connection > 300:  # 5 minutes
-                            logger.info(f"No log file found for 5 minutes, reconnecting SFTP for server {server_id}")
-                            await sftp_client.disconnect()
-                            
-                            reconnect_attempts += 1
-                            if reconnect_attempts > max_reconnect_attempts:
-                                logger.error(f"Maximum reconnection attempts ({max_reconnect_attempts}) reached for server {server_id}")
-                                break
-                                
-                            # Exponential backoff
-                            backoff_time = min(backoff_time * 2, 60)  # Max 60 seconds
-                            logger.info(f"Waiting {backoff_time} seconds before reconnecting (attempt {reconnect_attempts}/{max_reconnect_attempts})")
-                            await asyncio.sleep(backoff_time)
-                            
-                            try:
-                                logger.info(f"Attempting to reconnect SFTP for server {server_id}")
-                                sftp_connected = await sftp_client.connect()
-                                if sftp_connected:
-                                    logger.info(f"Successfully reconnected SFTP for server {server_id}")
-                                    # Reset backoff and reconnect attempts on successful connection
-                                    backoff_time = 5
-                                    reconnect_attempts = 0
-                                    last_successful_connection = time.time()
-                                else:
-                                    logger.error(f"Failed to reconnect SFTP for server {server_id}")
-                            except Exception as reconnect_e:
-                                logger.error(f"Error reconnecting SFTP for server {server_id}: {reconnect_e}")
-                                
                         # Wait before trying again
                         await asyncio.sleep(EVENTS_REFRESH_INTERVAL)
                         continue
                         
-                    # Process log file for events and connection messages
+                    last_successful_connection = time.time()
+                    
+                    # Reset backoff and reconnect attempts on successful connection
+                    backoff_time = 5
+                    reconnect_attempts = 0
+                    
+                    # Process new log lines for events and connection messages
                     if log_file:
-                        last_successful_connection = time.time()
-                        
-                        # Reset backoff and reconnect attempts on successful connection
-                        backoff_time = 5
-                        reconnect_attempts = 0
+                        # Classify entries off the event loop, then dispatch the sends here
+                        classified = await asyncio.to_thread(classify_entries, log_file, 'voice' in handlers)
                         
-                        # Parse log entries
-                        for entry in log_file:
-                            message = entry.get('message', '')
-                            timestamp = entry.get('timestamp')
-                            
-                            # Check for event messages
-                            try:
-                                # Process events
-                                # Check if the message contains event data
-                                event_data = None
-                                for event_type in ['mission', 'airdrop', 'crash', 'heli crash', 'trader', 'convoy', 'encounter', 'server restart']:
-                                    if event_type.lower() in message.lower():
-                                        event_data = {
-                                            'type': event_type,
-                                            'message': message,
-                                            'timestamp': timestamp
-                                        }
-                                        break
-                                
-                                if event_data:
-                                    # Process event
-                                    await process_event(self.bot, server, event_data, events_channel if channel_configured else None)
-                            except Exception as event_e:
-                                logger.error(f"Error processing event message: {event_e}")
-                                logger.error(f"Message was: {message}")
-                                continue  # Skip this message and continue with the next
-                                
-                            # Check for connection messages
+                        for kind, payload in classified:
                             try:
-                                # Process connections (player joins/leaves)
-                                connection_data = None
-                                if "connected" in message.lower() or "disconnected" in message.lower():
-                                    # Extract player name and connection status
-                                    connection_data = {
-                                        'message': message,
-                                        'timestamp': timestamp
-                                    }
-                                
-                                if connection_data:
-                                    # Process connection
-                                    await process_connection(self.bot, server, connection_data, connections_channel)
-                            except Exception as conn_e:
-                                logger.error(f"Error processing connection message: {conn_e}")
-                                logger.error(f"Message was: {message}")
-                                continue  # Skip this message and continue with the next
-                                
-                            # Check for voice calls
-                            try:
-                                # This is custom handling for voice communications events
-                                # Only enable if server supports it
-                                if hasattr(server, 'voice_notifications_enabled') and server.voice_notifications_enabled:
-                                    if "voice call" in message.lower():
-                                        # Extract voice call data
-                                        await process_voice_call(self.bot, server, message, timestamp, events_channel)
-                            except Exception as voice_e:
-                                logger.error(f"Error processing voice call message: {voice_e}")
-                                logger.error(f"Message was: {message}")
-                                continue  # Skip this message and continue with the next
+                                await handlers[kind](payload)
+                            except Exception as process_e:
+                                logger.error(f"Error processing {kind} message: {process_e}")
+                                logger.error(f"Message was: {payload['message']}")
                     
-                    # Update monitoring status in database
-                    try:
-                        await self.bot.db.monitoring.update_one(
-                            {"guild_id": guild_id, "server_id": server_id, "type": "events"},
-                            {"$set": {"last_updated": datetime.datetime.utcnow()}}
-                        )
-                    except asyncio.CancelledError:
-                        # Allow cancellation to propagate
-                        raise
-                    except Exception as e:
-                        # Log but continue
-                        logger.error(f"Error updating monitoring status in database: {e}")
+                    # Save the read position right away so a restart doesn't replay
+                    # events that were already handled
+                    if (log_offset, log_head_sig) != saved_position:
+                        try:
+                            await self.bot.db.monitoring.update_one(
+                                monitoring_filter,
+                                {"$set": {
+                                    "last_log_offset": log_offset,
+                                    "log_head_sig": log_head_sig
+                                }}
+                            )
+                            saved_position = (log_offset, log_head_sig)
+                        except Exception as db_e:
+                            logger.error(f"Error saving log position for server {server_id}: {db_e}")
+                    
+                    # Buffer the heartbeat; it is written by the periodic batch flush
+                    queue_status(self.bot, guild_id, server_id, "events", {})
                         
                     # Success, wait for next interval
                     await asyncio.sleep(EVENTS_REFRESH_INTERVAL)
@@ -388,9 +415,9 @@
                     # Update monitoring status with error
                     try:
                         await self.bot.db.monitoring.update_one(
-                            {"guild_id": guild_id, "server_id": server_id, "type": "events"},
+                            monitoring_filter,
                             {"$set": {
-                                "last_updated": datetime.datetime.utcnow(),
+                                "last_updated": utcnow(),
                                 "error": str(e)
                             }}
                         )
@@ -405,19 +432,10 @@
                         logger.info(f"Events monitor for server {server_id} in guild {guild_id} cancelled during error recovery")
                         break
                         
-                    # Try to reconnect if it's a connection issue
+                    # Broken clients are discarded by the pool on release, so the
+                    # next acquire reconnects
                     if "ConnectionRefusedError" in str(e) or "TimeoutError" in str(e) or "EOFError" in str(e):
-                        logger.info(f"Connection error detected, attempting to reconnect SFTP for server {server_id}")
-                        try:
-                            await sftp_client.disconnect()
-                            sftp_connected = await sftp_client.connect()
-                            if sftp_connected:
-                                logger.info(f"Successfully reconnected SFTP for server {server_id} after connection error")
-                                last_successful_connection = time.time()
-                            else:
-                                logger.error(f"Failed to reconnect SFTP for server {server_id} after connection error")
-                        except Exception as reconnect_e:
-                            logger.error(f"Error reconnecting SFTP for server {server_id} after connection error: {reconnect_e}")
+                        logger.info(f"Connection error detected, SFTP for server {server_id} will reconnect on next poll")
                 
         except Exception as e:
             logger.error(f"Unexpected error in events monitor: {e}", exc_info=True)
@@ -426,13 +444,19 @@
             # No need to clean up SFTP connection as killfeed monitor might be using it
             logger.info(f"Events monitor for server {server_id} stopped")
             
+            # Write the buffered heartbeats now rather than losing the last interval
+            try:
+                await flush_status(self.bot)
+            except Exception as flush_e:
+                logger.error(f"Error flushing monitoring status during shutdown: {flush_e}")
+            
             # Mark as stopped in database
             try:
                 await self.bot.db.monitoring.update_one(
-                    {"guild_id": guild_id, "server_id": server_id, "type": "events"},
+                    monitoring_filter,
                     {"$set": {
                         "running": False,
-                        "last_updated": datetime.datetime.utcnow()
+                        "last_updated": utcnow()
                     }}
                 )
             except Exception as db_e:
@@ -10,6 +10,7 @@ import uuid
 import concurrent.futures
 
 from models.base_model import BaseModel
+from utils.model_cache import invalidate_guild, invalidate_server
 
 logger = logging.getLogger(__name__)
 
@@ -266,6 +267,8 @@ class Guild(BaseModel):
         except Exception as e:
             logger.error(f"Error saving server to collections: {e}")
 
+        invalidate_guild(self.guild_id)
+        invalidate_server(self.guild_id, server_data.get("server_id"))
         return result.modified_count > 0
 
     async def remove_server(self, server_id: Union[str, int, None]) -> bool:
@@ -424,6 +427,8 @@ class Guild(BaseModel):
         logger.info(f"Servers collection - Exact: {standalone_exact.deleted_count}, Regex: {standalone_result.deleted_count}, Numeric: {standalone_numeric}")
         logger.info(f"Game servers - Exact: {game_exact.deleted_count}, Regex: {game_regex.deleted_count}, Numeric: {game_numeric}")
 
+        invalidate_guild(self.guild_id)
+        invalidate_server(self.guild_id)
         return guild_result.modified_count > 0 or standalone_count > 0 or game_count > 0
 
     async def get_server(self, server_id: Union[str, int, None]) -> Optional[Dict[str, Any]]:
@@ -673,6 +678,7 @@ class Guild(BaseModel):
                 }}
             )
 
+            invalidate_guild(self.guild_id)
             success = update_result.success and update_result.modified_count > 0
             if success is not None:
                 logger.info(f"Successfully updated premium tier for guild {self.guild_id} to {tier_int}")
@@ -705,6 +711,7 @@ class Guild(BaseModel):
                 "updated_at": self.updated_at
             }}
         )
+        invalidate_guild(self.guild_id)
 
         return result.modified_count > 0
 
@@ -735,6 +742,7 @@ class Guild(BaseModel):
                 "updated_at": self.updated_at
             }}
         )
+        invalidate_guild(self.guild_id)
 
         return result.modified_count > 0
 
@@ -762,6 +770,7 @@ class Guild(BaseModel):
                 "updated_at": self.updated_at
             }}
         )
+        invalidate_guild(self.guild_id)
 
         return result.modified_count > 0
 
@@ -812,6 +821,7 @@ class Guild(BaseModel):
             {"guild_id": self.guild_id},
             {"$set": update_dict}
         )
+        invalidate_guild(self.guild_id)
 
         return result.modified_count > 0
 
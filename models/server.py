@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional, ClassVar, List
 
 from models.base_model import BaseModel
+from utils.model_cache import invalidate_guild, invalidate_server
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +151,7 @@ class Server(BaseModel):
                 )
                 logger.info(f"Updated server in servers collection: {servers_result.modified_count} modified, {servers_result.upserted_id != None} upserted")
 
+            invalidate_server(self.guild_id, self.server_id)
             return success
         except Exception as e:
             logger.error(f"Error saving server {self.server_id}: {e}")
@@ -581,6 +583,7 @@ class Server(BaseModel):
             {"server_id": self.server_id},
             {"$set": update_dict}
         )
+        invalidate_server(self.guild_id, self.server_id)
 
         return result.modified_count > 0
 
@@ -626,6 +629,7 @@ class Server(BaseModel):
                 "updated_at": self.updated_at
             }}
         )
+        invalidate_server(self.guild_id, self.server_id)
 
         return result.modified_count > 0
 
@@ -650,6 +654,7 @@ class Server(BaseModel):
                 "updated_at": self.updated_at
             }}
         )
+        invalidate_server(self.guild_id, self.server_id)
 
         return result.modified_count > 0
 
@@ -677,6 +682,7 @@ class Server(BaseModel):
             {"server_id": self.server_id},
             {"$set": update_data}
         )
+        invalidate_server(self.guild_id, self.server_id)
 
         return result.modified_count > 0
 
@@ -1042,6 +1048,9 @@ class Server(BaseModel):
                 f"- Guilds updated: {guild_count}"
             )
 
+            invalidate_server(self.guild_id, self.server_id)
+            if self.guild_id:
+                invalidate_guild(self.guild_id)
             return success
 
         except Exception as e:
@@ -5,11 +5,15 @@ This script applies necessary patches to cog files to ensure compatibility
 with py-cord 2.6.1, fixing common issues that prevent cogs from loading.
 """
 
+import hashlib
 import os
 import sys
 import re
-import glob
+import json
 import logging
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Configure logging
@@ -19,77 +23,211 @@ logging.basicConfig(
 )
 logger = logging.getLogger("PatchCogs")
 
-# Common patterns that need to be fixed
-PATTERNS = [
+# Plain text rewrites, applied with str.replace since they need no regex.
+# Optional prefixes are spelled out as separate entries.
+LITERAL_REWRITES = [
     # Fix imports
-    (r'from discord\.ext import commands', 'from discord.ext import commands'),
-    (r'import discord\.ext\.commands', 'from discord.ext import commands'),
-    
-    # Fix cog setup functions
-    (r'def setup\s*\(\s*bot\s*\):', 'def setup(bot):'),
-    
-    # Fix common attribute errors
-    (r'interaction\.response\.send_message', 'interaction.response.send_message'),
-    (r'ctx\.send', 'ctx.send'),
+    ('import discord.ext.commands', 'from discord.ext import commands'),
     
     # Fix slash command definitions for py-cord 2.6.1
-    (r'@(?:commands\.)?slash_command\(', '@commands.slash_command('),
+    ('@slash_command(', '@commands.slash_command('),
     
     # Fix context menu commands
-    (r'@(?:commands\.)?(?:user|message)_command\(', '@commands.slash_command('),
-    
-    # Fix interaction responses for py-cord 2.6.1
-    (r'await interaction\.response\.defer\(\)', 'await interaction.response.defer()'),
+    ('@user_command(', '@commands.slash_command('),
+    ('@commands.user_command(', '@commands.slash_command('),
+    ('@message_command(', '@commands.slash_command('),
+    ('@commands.message_command(', '@commands.slash_command('),
     
     # Fix component callbacks
-    (r'@(?:discord\.)?ui\.button\(', '@discord.ui.button('),
-    (r'@(?:discord\.)?ui\.select\(', '@discord.ui.select('),
+    ('@ui.button(', '@discord.ui.button('),
+    ('@ui.select(', '@discord.ui.select('),
+]
+
+# Patterns that need a regex, compiled once at import.
+# Each rule is (needle, pattern, replacement): the pattern only runs when
+# the literal needle occurs in the file, which skips most rules cheaply.
+REGEX_REWRITES = [
+    # Fix cog setup functions
+    ('def setup', re.compile(r'def setup\s*\(\s*bot\s*\):'), 'def setup(bot):'),
 ]
 
 # Critical fixes needed in specific files
 FILE_SPECIFIC_FIXES = {
     'bot.py': [
-        # Fix Bot class initialization
-        (r'class Bot\(commands\.Bot\):', 'class Bot(commands.Bot):'),
         # Fix intents setup
-        (r'intents\s*=\s*discord\.Intents\.default\(\)', 'intents = discord.Intents.default()\n        intents.message_content = True\n        intents.members = True'),
+        ('Intents.default()', re.compile(r'intents\s*=\s*discord\.Intents\.default\(\)'), 'intents = discord.Intents.default()\n        intents.message_content = True\n        intents.members = True'),
         # Fix initialization method
-        (r'def __init__\(\s*self\s*,\s*\*\s*,\s*production\s*:\s*bool\s*=\s*False', 'def __init__(self, *, production: bool = False'),
+        ('production', re.compile(r'def __init__\(\s*self\s*,\s*\*\s*,\s*production\s*:\s*bool\s*=\s*False'), 'def __init__(self, *, production: bool = False'),
     ],
     # Add other files that need specific fixes here
 }
 
+def _is_identity(pattern, replacement):
+    """Check whether a rule can only ever replace text with itself."""
+    if isinstance(pattern, str):
+        return pattern == replacement
+    # A pattern that is just the escaped replacement matches nothing else
+    return pattern.pattern == re.escape(replacement)
+
+def _validate_rules(rules, label):
+    """Drop no-op rules, warning so they can be removed from the source."""
+    valid = []
+    for rule in rules:
+        pattern, replacement = rule[-2], rule[-1]
+        if _is_identity(pattern, replacement):
+            shown = pattern if isinstance(pattern, str) else pattern.pattern
+            logger.warning(f"Ignoring no-op {label} rule: {shown!r}")
+            continue
+        valid.append(rule)
+    return valid
+
+LITERAL_REWRITES = _validate_rules(LITERAL_REWRITES, 'literal')
+REGEX_REWRITES = _validate_rules(REGEX_REWRITES, 'regex')
+FILE_SPECIFIC_FIXES = {
+    name: _validate_rules(rules, name) for name, rules in FILE_SPECIFIC_FIXES.items()
+}
+
+def fuse_rules(rules):
+    """Combine (needle, pattern, replacement) rules into one alternation regex.
+
+    Each rule becomes a named group r<index>, so a single pass over the
+    content can dispatch every match to its replacement by group name.
+    """
+    fused = re.compile('|'.join(
+        f'(?P<r{index}>{pattern.pattern})' for index, (_, pattern, _) in enumerate(rules)
+    ))
+    replacements = {f'r{index}': replacement for index, (_, _, replacement) in enumerate(rules)}
+    needles = tuple(needle for needle, _, _ in rules)
+    return needles, fused, replacements
+
+def apply_fused(content, fused_rules):
+    """Apply fused rules in one pass, returning (content, changes)."""
+    needles, fused, replacements = fused_rules
+    if not any(needle in content for needle in needles):
+        return content, 0
+    
+    changes = 0
+    
+    def replace(match):
+        nonlocal changes
+        replacement = replacements[match.lastgroup]
+        # Patterns also match text that is already correct
+        if match.group() != replacement:
+            changes += 1
+        return replacement
+    
+    return fused.sub(replace, content), changes
+
+FUSED_PATTERNS = fuse_rules(REGEX_REWRITES)
+
+# File-specific fixes fused once per file name
+FUSED_BY_NAME = {name: fuse_rules(rules) for name, rules in FILE_SPECIFIC_FIXES.items()}
+
+def build_trigger(literal_rules, regex_rules):
+    """Build a bytes regex matching anywhere at least one rule would change the file.
+    
+    Regex rules are guarded with a lookahead for their replacement, so text
+    that is already in the patched form does not count as a trigger.
+    """
+    alternatives = [re.escape(old) for old, _ in literal_rules]
+    alternatives += [
+        f'(?!{re.escape(replacement)})(?:{pattern.pattern})'
+        for _, pattern, replacement in regex_rules
+    ]
+    return re.compile('|'.join(alternatives).encode('utf-8'))
+
+# Checked against a memory map of each file before it is decoded
+ANY_TRIGGER = build_trigger(LITERAL_REWRITES, REGEX_REWRITES)
+TRIGGER_BY_NAME = {
+    name: build_trigger(LITERAL_REWRITES, REGEX_REWRITES + rules)
+    for name, rules in FILE_SPECIFIC_FIXES.items()
+}
+
+def has_trigger(file_path, trigger):
+    """Check a file for a trigger through mmap, without reading it into a string."""
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return trigger.search(mm) is not None
+
+# Files known to need no patches, keyed by path with their (mtime_ns, size)
+CACHE_FILE = '.patch_cogs.cache.json'
+
+def rules_fingerprint():
+    """Hash this script's source, which holds every rewrite rule.
+    
+    Files marked clean under one set of rules may need patching under the
+    next, so the clean-file cache is only valid for the same fingerprint.
+    """
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_clean_cache(fingerprint):
+    """Load the clean-file cache, returning an empty cache if unreadable
+    or written for different rules."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('rules') != fingerprint:
+            return {}
+        return {path: tuple(entry) for path, entry in data['files'].items()}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+def save_clean_cache(cache, fingerprint):
+    """Save the clean-file cache along with the rules fingerprint."""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'rules': fingerprint, 'files': cache}, f)
+    except OSError as e:
+        logger.warning(f"Could not save patch cache: {e}")
+
+# Newest mtime of the cog trees when they were last patched
+STAMP_FILE = '.patch_cogs.stamp'
+
+def file_signature(file_path):
+    """Get the (mtime_ns, size) signature used by the clean-file cache."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
+
 def apply_patches_to_file(file_path, dry_run=False):
     """Apply patches to a specific file."""
     logger.info(f"Patching file: {file_path}")
     
+    # Most files need nothing; find that out without decoding them
+    trigger = TRIGGER_BY_NAME.get(os.path.basename(file_path), ANY_TRIGGER)
+    if not has_trigger(file_path, trigger):
+        logger.info(f"No changes needed for {file_path}")
+        return 0
+    
     # Read the file
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
     
     original_content = content
     changes_made = 0
     
-    # Apply common patterns
-    for pattern, replacement in PATTERNS:
-        new_content = re.sub(pattern, replacement, content)
-        if new_content != content:
-            changes_made += 1
-            content = new_content
+    # Apply plain text rewrites
+    for old, new in LITERAL_REWRITES:
+        if old in content:
+            changes_made += content.count(old)
+            content = content.replace(old, new)
+    
+    # Apply common patterns in a single pass
+    content, changes = apply_fused(content, FUSED_PATTERNS)
+    changes_made += changes
     
     # Apply file-specific fixes if available
-    file_name = os.path.basename(file_path)
-    if file_name in FILE_SPECIFIC_FIXES:
-        for pattern, replacement in FILE_SPECIFIC_FIXES[file_name]:
-            new_content = re.sub(pattern, replacement, content)
-            if new_content != content:
-                changes_made += 1
-                content = new_content
+    fused_fixes = FUSED_BY_NAME.get(os.path.basename(file_path))
+    if fused_fixes is not None:
+        content, changes = apply_fused(content, fused_fixes)
+        changes_made += changes
     
     # Write the changes if not a dry run
     if not dry_run and content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        path.write_text(content, encoding='utf-8')
         logger.info(f"Applied {changes_made} patches to {file_path}")
     elif content != original_content:
         logger.info(f"Would apply {changes_made} patches to {file_path} (dry run)")
@@ -98,22 +236,74 @@ def apply_patches_to_file(file_path, dry_run=False):
     
     return changes_made
 
+def iter_py_files(root):
+    """Yield the paths of all .py files below root.
+    
+    Uses os.scandir so directory checks come from the cached entry type
+    instead of a separate stat per entry.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Could not scan {directory}: {e}")
+
+def patch_files(file_paths, dry_run=False):
+    """Patch files in parallel worker processes, returning changes per file."""
+    if len(file_paths) < 2:
+        return [apply_patches_to_file(path, dry_run) for path in file_paths]
+    
+    try:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(
+                partial(apply_patches_to_file, dry_run=dry_run), file_paths, chunksize=8
+            ))
+    except (OSError, NotImplementedError) as e:
+        # Some sandboxes cannot create process pools
+        logger.warning(f"Process pool unavailable, patching serially: {e}")
+        return [apply_patches_to_file(path, dry_run) for path in file_paths]
+
 def patch_all_cogs(cogs_dir='cogs', dry_run=False):
     """Patch all cog files in the specified directory."""
     logger.info(f"Patching all cogs in {cogs_dir}")
     
     # Get all Python files in the cogs directory
-    cog_files = glob.glob(os.path.join(cogs_dir, '**', '*.py'), recursive=True)
+    cog_files = list(iter_py_files(cogs_dir))
     
     if not cog_files:
         logger.warning(f"No Python files found in {cogs_dir}")
         return 0
     
+    fingerprint = rules_fingerprint()
+    cache = load_clean_cache(fingerprint)
+    
+    # Unchanged since they were last found (or made) clean
+    pending = [path for path in cog_files if cache.get(path) != file_signature(path)]
+    skipped = len(cog_files) - len(pending)
+    
+    results = patch_files(pending, dry_run)
+    
     total_changes = 0
-    for file_path in cog_files:
-        changes = apply_patches_to_file(file_path, dry_run)
+    for file_path, changes in zip(pending, results):
         total_changes += changes
+        
+        # A dry run leaves patched files untouched, so they are not clean yet
+        if changes and dry_run:
+            cache.pop(file_path, None)
+        else:
+            cache[file_path] = file_signature(file_path)
     
+    save_clean_cache(cache, fingerprint)
+    
+    if skipped:
+        logger.info(f"Skipped {skipped} unchanged files")
     logger.info(f"Applied a total of {total_changes} patches to {len(cog_files)} files")
     return total_changes
 
@@ -141,6 +331,52 @@ def patch_main_files(dry_run=False):
     logger.info(f"Applied a total of {total_changes} patches to main files")
     return total_changes
 
+def tree_mtime(root):
+    """Get the newest mtime_ns of root and everything below it.
+    
+    Only directory entries are stat'ed; file contents are never read.
+    __pycache__ directories are ignored since importing cogs rewrites them.
+    """
+    try:
+        newest = os.stat(root).st_mtime_ns
+    except OSError:
+        return 0
+    
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == '__pycache__':
+                        continue
+                    newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not scan {directory}: {e}")
+    return newest
+
+def trees_stamp(roots):
+    """Get the stamp for the cog trees, including this script so rule changes count."""
+    return max([tree_mtime(root) for root in roots] + [os.stat(__file__).st_mtime_ns])
+
+def read_stamp():
+    """Read the stamp recorded by the last run, or None."""
+    try:
+        with open(STAMP_FILE, 'r', encoding='utf-8') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def write_stamp(stamp):
+    """Record the stamp for the next run."""
+    try:
+        with open(STAMP_FILE, 'w', encoding='utf-8') as f:
+            f.write(str(stamp))
+    except OSError as e:
+        logger.warning(f"Could not save patch stamp: {e}")
+
 def main():
     """Main entry point."""
     logger.info("Starting cog patching")
@@ -153,12 +389,23 @@ def main():
     # Patch main files
     patch_main_files(dry_run)
     
-    # Patch all cogs
-    patch_all_cogs('cogs', dry_run)
-    
+    cog_dirs = ['cogs']
     # Also patch any cogs in the commands directory
     if os.path.exists('commands'):
-        patch_all_cogs('commands', dry_run)
+        cog_dirs.append('commands')
+    
+    # Nothing in the cog trees changed since the last run
+    if read_stamp() == trees_stamp(cog_dirs):
+        logger.info("Cog directories unchanged since last run, skipping")
+        logger.info("Cog patching completed")
+        return
+    
+    for cogs_dir in cog_dirs:
+        patch_all_cogs(cogs_dir, dry_run)
+    
+    # Stamp after patching, since patched files get new mtimes
+    if not dry_run:
+        write_stamp(trees_stamp(cog_dirs))
     
     logger.info("Cog patching completed")
 
@@ -8,13 +8,46 @@ Import this module before importing discord to ensure py-cord is used properly.
 import os
 import sys
 import importlib
+import importlib.util
 from pathlib import Path
 
-# First ensure we load real discord from py-cord if available
-try:
+# Sidecar module recording where py-cord was found on a previous run
+_LOCATION_FILE = os.path.join(os.path.dirname(__file__), "_pycord_location.py")
+
+def _cached_pycord_path():
+    """Get the py-cord location recorded by a previous run, if still valid"""
+    if not os.path.isfile(_LOCATION_FILE):
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location("_pycord_location", _LOCATION_FILE)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        path = module.PATH
+    except Exception:
+        return None
+    return path if os.path.isdir(path) else None
+
+def _record_pycord_path(module):
+    """Record the directory py-cord was imported from for later runs"""
+    path = str(Path(module.__file__).resolve().parent.parent)
+    try:
+        with open(_LOCATION_FILE, "w", encoding="utf-8") as f:
+            f.write(f"PATH = {path!r}\n")
+    except OSError:
+        pass
+
+def _forget_pycord_path():
+    """Remove a recorded py-cord location that no longer yields py-cord"""
+    try:
+        os.remove(_LOCATION_FILE)
+    except OSError:
+        pass
+
+def _probe_pycord_paths():
+    """Reset any imported discord and put the known py-cord locations first"""
     # Try removing the discord module if it's already been imported
-    if 'discord' in sys.modules:
-        del sys.modules['discord']
+    for name in [name for name in sys.modules if name == 'discord' or name.startswith('discord.')]:
+        del sys.modules[name]
     
     # Now try to locate and add py-cord directly to the import path
     pycord_paths = [
@@ -29,14 +62,41 @@ try:
     for pycord_path in pycord_paths:
         if pycord_path.exists() and str(pycord_path) not in sys.path:
             sys.path.insert(0, str(pycord_path))
+
+def _is_pycord(module):
+    """Check for slash_command, which only py-cord's Bot provides"""
+    return hasattr(module.ext.commands.Bot, "slash_command")
+
+# First ensure we load real discord from py-cord if available
+try:
+    cached_path = _cached_pycord_path()
+    
+    if cached_path is not None:
+        # Known location, no need to probe or reload discord. It goes first
+        # so py-cord wins over any other discord package on the path
+        if cached_path not in sys.path:
+            sys.path.insert(0, cached_path)
+    else:
+        _probe_pycord_paths()
     
     # Try importing discord (hopefully py-cord)
     import discord
     
+    if cached_path is not None and not _is_pycord(discord):
+        # The recorded location is stale; drop it and probe as on a first run
+        print("Warning: Recorded py-cord location no longer provides py-cord, probing again.")
+        _forget_pycord_path()
+        sys.path.remove(cached_path)
+        cached_path = None
+        _probe_pycord_paths()
+        import discord
+    
     # Verify this is py-cord by checking for slash_command attribute
-    if not hasattr(discord.ext.commands.Bot, "slash_command"):
+    if not _is_pycord(discord):
         print("Warning: Imported discord is not py-cord. Adapter failed.")
     else:
+        if cached_path is None:
+            _record_pycord_path(discord)
         print(f"Successfully loaded py-cord as discord: {discord.__version__}")
 except Exception as e:
     print(f"Error in py-cord adapter: {e}")
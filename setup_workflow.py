@@ -8,6 +8,7 @@ import json
 import os
 import sys
 import logging
+from pathlib import Path
 
 # Set up logging
 logging.basicConfig(
@@ -39,8 +40,9 @@ def create_workflow_file():
     
     # Write to file
     workflow_path = ".replit.workflow"
-    with open(workflow_path, 'w') as f:
-        json.dump(workflow_content, f, indent=2)
+    # Serialize up front so the file is written in one call rather than
+    # one write per JSON chunk
+    Path(workflow_path).write_text(json.dumps(workflow_content, indent=2))
     logger.info(f"Created workflow file at {workflow_path}")
     
     return workflow_path
@@ -73,8 +75,7 @@ deploymentTarget = "cloudrun"
     
     # Write to file
     replit_path = ".replit"
-    with open(replit_path, 'w') as f:
-        f.write(replit_content.strip())
+    Path(replit_path).write_text(replit_content.strip())
     logger.info(f"Created Replit configuration at {replit_path}")
     
     return replit_path
@@ -140,8 +141,7 @@ if __name__ == "__main__":
     
     # Write to file
     script_path = "run_workflow.py"
-    with open(script_path, 'w') as f:
-        f.write(script_content)
+    Path(script_path).write_text(script_content)
     
     # Make executable
     os.chmod(script_path, 0o755)
@@ -53,18 +53,24 @@ class BasicBot(commands.Bot):
     async def load_all_cogs(self):
         """Load all cogs from the cogs directory"""
         cogs_dir = 'cogs'
-        if not os.path.isdir(cogs_dir):
+        try:
+            # One scandir pass; DirEntry.is_file uses the cached entry type
+            with os.scandir(cogs_dir) as it:
+                filenames = [
+                    entry.name for entry in it
+                    if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('_')
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Cogs directory '{cogs_dir}' not found")
             return
         
-        for filename in os.listdir(cogs_dir):
-            if filename.endswith('.py') and not filename.startswith('_'):
-                cog_name = f"{cogs_dir}.{filename[:-3]}"
-                try:
-                    await self.load_extension(cog_name)
-                    logger.info(f"Loaded cog: {cog_name}")
-                except Exception as e:
-                    logger.error(f"Failed to load cog {cog_name}: {e}")
+        for filename in filenames:
+            cog_name = f"{cogs_dir}.{filename[:-3]}"
+            try:
+                await self.load_extension(cog_name)
+                logger.info(f"Loaded cog: {cog_name}")
+            except Exception as e:
+                logger.error(f"Failed to load cog {cog_name}: {e}")
     
     async def on_ready(self):
         """Called when the bot is ready"""
@@ -6,7 +6,7 @@ This script loads and tests a specific migrated cog to ensure it works correctly
 with py-cord 2.6.1 and the compatibility layers.
 
 Usage:
-    python test_migrated_cog.py --cog=cog_name [--verbose] [--skip-db] [--token TOKEN]
+    python test_migrated_cog.py --cog=cog_name[,cog_name...] [--verbose] [--skip-db] [--token TOKEN]
 """
 
 import argparse
@@ -18,6 +18,8 @@ import os
 import sys
 import time
 import traceback
+from collections import defaultdict
+from types import MappingProxyType
 from typing import Dict, List, Optional, Set, Tuple, Any
 
 # Configure logging
@@ -30,17 +32,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger("test_migrated_cog")
 
-# Import Discord compatibility layer
-try:
-    from utils.discord_compat import discord, commands, is_pycord, is_pycord_261
-except ImportError:
-    logger.error("Could not import discord_compat module. Make sure it exists in utils/")
-    sys.exit(1)
+# Discord compatibility layer, imported on first use so argument errors
+# and --help do not pay for loading py-cord
+_discord = None
+
+
+def _get_discord():
+    """Import the Discord compatibility layer once, returning (discord, commands)"""
+    global _discord
+    if _discord is None:
+        try:
+            from utils.discord_compat import discord, commands
+        except ImportError:
+            logger.error("Could not import discord_compat module. Make sure it exists in utils/")
+            sys.exit(1)
+        _discord = (discord, commands)
+    return _discord
+
+
+# Cog class -> [(attribute name, SlashCommandGroup)], computed once per class
+_groups_cache: Dict[type, List[Tuple[str, Any]]] = {}
+
+# id(group) -> [(attribute name, callable)], computed once per group
+_group_members_cache: Dict[int, List[Tuple[str, Any]]] = {}
+
+
+def class_command_groups(cls):
+    """Get the SlashCommandGroup attributes of a cog class, cached per class"""
+    groups = _groups_cache.get(cls)
+    if groups is None:
+        # Walk the class dicts directly; later classes in reversed MRO override
+        discord, _ = _get_discord()
+        attrs = {}
+        for klass in reversed(cls.__mro__):
+            attrs.update(vars(klass))
+        groups = _groups_cache[cls] = sorted(
+            (name, value) for name, value in attrs.items()
+            if isinstance(value, discord.SlashCommandGroup)
+        )
+    return groups
+
+
+def group_commands(group):
+    """Get the public callable members of a command group, cached per group"""
+    members = _group_members_cache.get(id(group))
+    if members is None:
+        members = _group_members_cache[id(group)] = [
+            (name, member) for name, member in inspect.getmembers(group)
+            if callable(member) and not name.startswith("_")
+        ]
+    return members
 
 
 class MockContext:
     """Mock Context for testing command responses"""
     
+    __slots__ = ('bot', '_guild_id', '_user_id', 'responses')
+    
     def __init__(self, bot, guild_id=123456789, user_id=987654321):
         self.bot = bot
         self._guild_id = guild_id
@@ -62,26 +110,28 @@ class MockContext:
     async def respond(self, content=None, embed=None, embeds=None, ephemeral=False, **kwargs):
         response = {"content": content, "embed": embed, "embeds": embeds, "ephemeral": ephemeral}
         self.responses.append(response)
-        logger.info(f"Response received: {content[:50] if content else 'No content'}")
+        logger.info("Response received: %.50s", content or "No content")
         if embed:
-            logger.info(f"Embed: {embed.title}")
+            logger.info("Embed: %s", embed.title)
         return MockMessage()
         
     async def send(self, content=None, embed=None, embeds=None, **kwargs):
         response = {"content": content, "embed": embed, "embeds": embeds}
         self.responses.append(response)
-        logger.info(f"Message sent: {content[:50] if content else 'No content'}")
+        logger.info("Message sent: %.50s", content or "No content")
         if embed:
-            logger.info(f"Embed: {embed.title}")
+            logger.info("Embed: %s", embed.title)
         return MockMessage()
         
     async def defer(self, ephemeral=False):
-        logger.info(f"Response deferred (ephemeral={ephemeral})")
+        logger.info("Response deferred (ephemeral=%s)", ephemeral)
 
 
 class MockGuild:
     """Mock Guild for testing"""
     
+    __slots__ = ('id', 'name')
+    
     def __init__(self, guild_id):
         self.id = guild_id
         self.name = f"Test Guild {guild_id}"
@@ -90,6 +140,8 @@ class MockGuild:
 class MockUser:
     """Mock User for testing"""
     
+    __slots__ = ('id', 'name', 'discriminator')
+    
     def __init__(self, user_id):
         self.id = user_id
         self.name = f"Test User {user_id}"
@@ -99,6 +151,8 @@ class MockUser:
 class MockMessage:
     """Mock Message for testing"""
     
+    __slots__ = ('id',)
+    
     def __init__(self):
         self.id = 123456789
         
@@ -119,107 +173,158 @@ class MockDatabase:
 
 
 class MockCollection:
-    """Mock MongoDB collection for testing"""
+    """Mock MongoDB collection for testing
+    
+    Documents are indexed by (key, value) so equality filters resolve with
+    set intersections instead of scanning every document.
+    
+    With freeze_reads set, find_one returns a read-only view of the stored
+    document instead of a copy; clear it on the class (or a subclass) for
+    cogs that modify the result.
+    """
+    
+    __slots__ = ('name', 'documents', '_indexes', '_order', '_next_order')
+    
+    freeze_reads = True
     
     def __init__(self, name):
         self.name = name
         self.documents = {}
+        # key -> value -> ids of documents with that value
+        self._indexes = defaultdict(lambda: defaultdict(set))
+        # id -> insertion sequence, so the first match is stable
+        self._order = {}
+        self._next_order = 0
+        
+    def _index_document(self, doc_id, doc):
+        """Add a document's fields to the indexes"""
+        for key, value in doc.items():
+            try:
+                self._indexes[key][value].add(doc_id)
+            except TypeError:
+                # Unhashable values are only matched by scanning
+                pass
+                
+    def _unindex_document(self, doc_id, doc):
+        """Remove a document's fields from the indexes"""
+        for key, value in doc.items():
+            values = self._indexes.get(key)
+            if values is None:
+                continue
+            try:
+                ids = values.get(value)
+            except TypeError:
+                continue
+            if ids:
+                ids.discard(doc_id)
+                if not ids:
+                    del values[value]
+                    
+    def _matching_ids(self, filter):
+        """Get the ids of all documents matching a filter"""
+        if not filter:
+            return set(self.documents)
+            
+        try:
+            id_sets = [
+                self._indexes[key].get(value, set()) if key in self._indexes else set()
+                for key, value in filter.items()
+            ]
+        except TypeError:
+            # Unhashable filter value, fall back to scanning
+            return {
+                doc_id for doc_id, doc in self.documents.items()
+                if all(key in doc and doc[key] == value for key, value in filter.items())
+            }
+            
+        id_sets.sort(key=len)
+        return set.intersection(*id_sets)
+        
+    def _first_match(self, filter):
+        """Get the id of the earliest inserted document matching a filter"""
+        ids = self._matching_ids(filter)
+        if not ids:
+            return None
+        return min(ids, key=self._order.__getitem__)
         
     async def insert_one(self, document):
         # Generate a document ID if not provided
         if "_id" not in document:
             document["_id"] = f"mock_id_{len(self.documents) + 1}"
             
+        doc_id = document["_id"]
+        if doc_id in self.documents:
+            self._unindex_document(doc_id, self.documents[doc_id])
+            
         # Store the document
-        self.documents[document["_id"]] = document.copy()
+        stored = document.copy()
+        self.documents[doc_id] = stored
+        self._index_document(doc_id, stored)
+        self._order[doc_id] = self._next_order
+        self._next_order += 1
         
-        logger.debug(f"Inserted document into {self.name}: {document['_id']}")
-        return MockInsertResult(document["_id"])
+        logger.debug("Inserted document into %s: %s", self.name, doc_id)
+        return MockInsertResult(doc_id)
         
     async def find_one(self, filter):
-        # Apply simple filter matching
-        for doc_id, doc in self.documents.items():
-            match = True
-            for key, value in filter.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-                    
-            if match:
-                logger.debug(f"Found document in {self.name}: {doc_id}")
-                return doc.copy()
-                
-        logger.debug(f"No document found in {self.name} matching {filter}")
+        doc_id = self._first_match(filter)
+        if doc_id is not None:
+            logger.debug("Found document in %s: %s", self.name, doc_id)
+            doc = self.documents[doc_id]
+            return MappingProxyType(doc) if self.freeze_reads else doc.copy()
+            
+        logger.debug("No document found in %s matching %s", self.name, filter)
         return None
         
     async def update_one(self, filter, update):
         count = 0
         
-        # Apply simple filter matching
-        for doc_id, doc in self.documents.items():
-            match = True
-            for key, value in filter.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
+        doc_id = self._first_match(filter)
+        if doc_id is not None:
+            doc = self.documents[doc_id]
+            self._unindex_document(doc_id, doc)
+            
+            # Apply updates
+            if "$set" in update:
+                for key, value in update["$set"].items():
+                    doc[key] = value
                     
-            if match:
-                # Apply updates
-                if "$set" in update:
-                    for key, value in update["$set"].items():
+            if "$inc" in update:
+                for key, value in update["$inc"].items():
+                    if key not in doc:
                         doc[key] = value
+                    else:
+                        doc[key] += value
                         
-                if "$inc" in update:
-                    for key, value in update["$inc"].items():
-                        if key not in doc:
-                            doc[key] = value
-                        else:
-                            doc[key] += value
-                            
-                count = 1
-                break
-                
-        logger.debug(f"Updated {count} document(s) in {self.name}")
+            self._index_document(doc_id, doc)
+            count = 1
+            
+        logger.debug("Updated %d document(s) in %s", count, self.name)
         return MockUpdateResult(count)
         
     async def delete_one(self, filter):
-        # Apply simple filter matching
-        for doc_id, doc in list(self.documents.items()):
-            match = True
-            for key, value in filter.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-                    
-            if match:
-                del self.documents[doc_id]
-                logger.debug(f"Deleted document from {self.name}: {doc_id}")
-                return MockDeleteResult(1)
-                
-        logger.debug(f"No document found to delete in {self.name}")
+        doc_id = self._first_match(filter)
+        if doc_id is not None:
+            self._unindex_document(doc_id, self.documents.pop(doc_id))
+            del self._order[doc_id]
+            logger.debug("Deleted document from %s: %s", self.name, doc_id)
+            return MockDeleteResult(1)
+            
+        logger.debug("No document found to delete in %s", self.name)
         return MockDeleteResult(0)
         
     async def count_documents(self, filter):
-        count = 0
+        count = len(self._matching_ids(filter))
         
-        # Apply simple filter matching
-        for doc in self.documents.values():
-            match = True
-            for key, value in filter.items():
-                if key not in doc or doc[key] != value:
-                    match = False
-                    break
-                    
-            if match:
-                count += 1
-                
-        logger.debug(f"Counted {count} document(s) in {self.name}")
+        logger.debug("Counted %d document(s) in %s", count, self.name)
         return count
 
 
 class MockInsertResult:
     """Mock insert result for testing"""
     
+    __slots__ = ('inserted_id', 'acknowledged')
+    
     def __init__(self, inserted_id):
         self.inserted_id = inserted_id
         self.acknowledged = True
@@ -228,6 +333,8 @@ class MockInsertResult:
 class MockUpdateResult:
     """Mock update result for testing"""
     
+    __slots__ = ('modified_count', 'matched_count', 'acknowledged')
+    
     def __init__(self, modified_count):
         self.modified_count = modified_count
         self.matched_count = modified_count
@@ -237,6 +344,8 @@ class MockUpdateResult:
 class MockDeleteResult:
     """Mock delete result for testing"""
     
+    __slots__ = ('deleted_count', 'acknowledged')
+    
     def __init__(self, deleted_count):
         self.deleted_count = deleted_count
         self.acknowledged = True
@@ -246,9 +355,12 @@ class MockBot:
     """Mock Bot for testing migrated cogs"""
     
     def __init__(self, skip_db=False):
+        discord, _ = _get_discord()
         self.intents = discord.Intents.default()
         self.cogs = {}
         self.commands = []
+        # (command path, handler) for every group command of the added cogs
+        self._commands = []
         self.event_listeners = {}
         self.skip_db = skip_db
         
@@ -261,12 +373,13 @@ class MockBot:
         """Add a cog to the bot"""
         cog_name = cog.__class__.__name__
         self.cogs[cog_name] = cog
-        logger.info(f"Added cog: {cog_name}")
+        logger.info("Added cog: %s", cog_name)
         
         # Register commands from the cog
-        for attr_name, attr_value in inspect.getmembers(cog.__class__):
-            if isinstance(attr_value, discord.SlashCommandGroup):
-                logger.info(f"Found SlashCommandGroup: {attr_name}")
+        for group_name, group in class_command_groups(cog.__class__):
+            logger.info("Found SlashCommandGroup: %s", group_name)
+            for cmd_name, cmd in group_commands(group):
+                self._commands.append((f"{group_name} {cmd_name}", cmd))
         
     def add_listener(self, func, name=None):
         """Add an event listener"""
@@ -277,7 +390,7 @@ class MockBot:
             self.event_listeners[name] = []
             
         self.event_listeners[name].append(func)
-        logger.debug(f"Added listener: {name}")
+        logger.debug("Added listener: %s", name)
         
     def event(self, func):
         """Register an event listener"""
@@ -294,6 +407,8 @@ class CogTester:
     
     def __init__(self, args):
         self.cog_name = args.cog
+        # --cog accepts a comma separated list of cogs
+        self.cog_names = [name.strip() for name in args.cog.split(",") if name.strip()]
         self.verbose = args.verbose
         self.skip_db = args.skip_db
         self.token = args.token
@@ -309,51 +424,53 @@ class CogTester:
         self.loaded_cogs = {}
         
     async def load_cog(self):
-        """Load the specified cog"""
-        try:
-            logger.info(f"Loading cog: {self.cog_name}")
-            
-            # Import the cog module
-            cog_path = f"cogs.{self.cog_name}"
-            cog_module = importlib.import_module(cog_path)
-            
-            # Call the setup function
-            if hasattr(cog_module, "setup"):
-                cog_module.setup(self.bot)
-                logger.info(f"Successfully loaded {self.cog_name}")
-                return True
-            else:
-                logger.error(f"Cog {self.cog_name} has no setup function")
-                return False
+        """Load the specified cogs
+        
+        Modules are imported in worker threads so their imports overlap and
+        the event loop is not blocked; setup functions then run in order.
+        """
+        logger.info(f"Loading cog: {self.cog_name}")
+        
+        # Import the cog modules
+        cog_modules = await asyncio.gather(
+            *(asyncio.to_thread(importlib.import_module, f"cogs.{name}") for name in self.cog_names),
+            return_exceptions=True
+        )
+        
+        success = bool(self.cog_names)
+        for name, cog_module in zip(self.cog_names, cog_modules):
+            try:
+                if isinstance(cog_module, BaseException):
+                    raise cog_module
+                    
+                # Call the setup function
+                if hasattr(cog_module, "setup"):
+                    cog_module.setup(self.bot)
+                    logger.info(f"Successfully loaded {name}")
+                else:
+                    logger.error(f"Cog {name} has no setup function")
+                    success = False
+                    
+            except Exception as e:
+                logger.error(f"Failed to load cog {name}: {e}")
+                traceback.print_exception(type(e), e, e.__traceback__)
+                success = False
                 
-        except Exception as e:
-            logger.error(f"Failed to load cog {self.cog_name}: {e}")
-            traceback.print_exc()
-            return False
+        return success
             
     def get_command_groups(self):
         """Get all command groups in the loaded cog"""
         command_groups = []
         
         for cog_name, cog_instance in self.bot.cogs.items():
-            for attr_name, attr_value in inspect.getmembers(cog_instance.__class__):
-                if isinstance(attr_value, discord.SlashCommandGroup):
-                    command_groups.append((attr_name, attr_value))
+            command_groups.extend(class_command_groups(cog_instance.__class__))
                     
         return command_groups
         
     def get_commands(self):
         """Get all commands in the loaded cog"""
-        commands = []
-        
-        # Get commands from command groups
-        command_groups = self.get_command_groups()
-        for group_name, group in command_groups:
-            for cmd_name, cmd in inspect.getmembers(group):
-                if callable(cmd) and not cmd_name.startswith("_"):
-                    commands.append((f"{group_name} {cmd_name}", cmd))
-                    
-        return commands
+        # Collected once per cog by MockBot.add_cog
+        return list(self.bot._commands)
         
     async def test_command(self, command_path, command_handler, ctx):
         """Test a command with mock context"""
@@ -437,7 +554,7 @@ async def main():
         "--cog", 
         type=str,
         required=True,
-        help="Name of the cog to test (without .py extension)"
+        help="Name of the cog to test (without .py extension), or a comma separated list"
     )
     parser.add_argument(
         "--verbose", 
@@ -0,0 +1,74 @@
+"""
+Test script for the fast CSV filename matchers
+
+This script checks that _is_map_basename and _is_standard_basename in
+utils.file_discovery agree with MAP_FILENAME_PATTERN.match and
+CSV_FILENAME_PATTERN.match on a table of ordinary and edge-case names.
+"""
+import logging
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("test_file_discovery_matchers")
+
+from utils.file_discovery import (
+    CSV_FILENAME_PATTERN,
+    MAP_FILENAME_PATTERN,
+    _is_map_basename,
+    _is_standard_basename,
+)
+
+# Basenames checked against both the regexes and the fast matchers
+BASENAMES = [
+    # Ordinary names
+    "2024.01.02-03.04.05.csv",
+    "map_2024.01.02-03.04.05.csv",
+    # Prefix before the timestamp
+    "server_2024.01.02-03.04.05.csv",
+    "backup-map_2024.01.02-03.04.05.csv",
+    "x2024.01.02-03.04.05.csv",
+    # map_ without a timestamp
+    "map_.csv",
+    "map_latest.csv",
+    "map_2024.01.02.csv",
+    # Wrong length
+    "2024.1.02-03.04.05.csv",
+    "2024.01.02-03.04.055.csv",
+    "12024.01.02-03.04.05.csv",
+    "map_2024.01.02-03.04.5.csv",
+    "map_2024.01.02-03.04.05x.csv",
+    "map_x2024.01.02-03.04.05.csv",
+    "map_2024.01.02-03.04.05.csv.csv",
+    ".csv",
+    "",
+    # Case and extension
+    "2024.01.02-03.04.05.CSV",
+    "map_2024.01.02-03.04.05.CSV",
+    "MAP_2024.01.02-03.04.05.csv",
+    "2024.01.02-03.04.05.csv.bak",
+    "2024.01.02-03.04.05.txt",
+    # Wrong separators
+    "2024-01-02-03-04-05.csv",
+    "map_2024.01.02_03.04.05.csv",
+]
+
+def test_map_basename_matches_regex():
+    for basename in BASENAMES:
+        expected = MAP_FILENAME_PATTERN.match(basename) is not None
+        assert _is_map_basename(basename) == expected, f"_is_map_basename({basename!r}) should be {expected}"
+    logger.info("_is_map_basename agrees with MAP_FILENAME_PATTERN")
+
+def test_standard_basename_matches_regex():
+    for basename in BASENAMES:
+        expected = CSV_FILENAME_PATTERN.match(basename) is not None
+        assert _is_standard_basename(basename) == expected, f"_is_standard_basename({basename!r}) should be {expected}"
+    logger.info("_is_standard_basename agrees with CSV_FILENAME_PATTERN")
+
+if __name__ == "__main__":
+    test_map_basename_matches_regex()
+    test_standard_basename_matches_regex()
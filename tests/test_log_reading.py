@@ -0,0 +1,169 @@
+"""
+Test script for incremental log reading and classification
+
+This script checks SFTPClient.read_since against an in-memory remote file
+(appends, partial lines, shrinking and rotated logs) and the output of
+split_log_entries and classify_entries used by the events monitor.
+"""
+import asyncio
+import logging
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("test_log_reading")
+
+from utils.sftp import SFTPClient, LOG_HEAD_SIG_SIZE
+from utils.event_classifier import classify_entries, split_log_entries
+
+LOG_PATH = "/logs/Deadside.log"
+
+class FakeAttrs:
+    """File attributes returned by FakeSFTP.stat"""
+
+    def __init__(self, size):
+        self.size = size
+
+class FakeFile:
+    """Open remote file reading from the owning FakeSFTP's data"""
+
+    def __init__(self, sftp):
+        self.sftp = sftp
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def read(self, size, offset):
+        self.sftp.reads.append((offset, size))
+        return self.sftp.data[offset:offset + size]
+
+class FakeSFTP:
+    """asyncssh SFTP client stand-in serving a single in-memory file"""
+
+    def __init__(self, data=b""):
+        self.data = data
+        self.reads = []
+
+    async def stat(self, path):
+        assert path == LOG_PATH
+        return FakeAttrs(len(self.data))
+
+    def open(self, path, mode, **kwargs):
+        assert path == LOG_PATH
+        return FakeFile(self)
+
+def make_client(sftp):
+    """Create an SFTPClient reading through a fake SFTP session"""
+    client = SFTPClient(hostname="localhost", server_id="test")
+    client._sftp_client = sftp
+
+    async def ensure_connected():
+        return None
+
+    client.ensure_connected = ensure_connected
+    return client
+
+async def check_append_and_partial_line():
+    """Only new bytes are read and a trailing partial line is kept back"""
+    sftp = FakeSFTP(b"[00:00:01] first\n[00:00:02] sec")
+    client = make_client(sftp)
+
+    chunk, offset, head = await client.read_since(LOG_PATH)
+    assert chunk == b"[00:00:01] first\n"
+    assert offset == len(chunk)
+    assert head == sftp.data[:LOG_HEAD_SIG_SIZE]
+
+    # Nothing new: no read at all
+    sftp.reads.clear()
+    assert await client.read_since(LOG_PATH, len(sftp.data), head) == (b"", len(sftp.data), head)
+    assert sftp.reads == []
+
+    # The partial line completes and another line follows
+    sftp.data += b"ond\n[00:00:03] third\n"
+    chunk, new_offset, new_head = await client.read_since(LOG_PATH, offset, head)
+    assert chunk == b"[00:00:02] second\n[00:00:03] third\n"
+    assert new_offset == len(sftp.data)
+    assert new_head == head
+    assert sftp.reads[-1] == (offset, len(sftp.data) - offset), "Only the bytes after offset should be read"
+    logger.info("Appended data is read incrementally, keeping partial lines")
+
+async def check_shrink_reads_from_start():
+    """A file smaller than the offset was truncated and is read from the start"""
+    sftp = FakeSFTP(b"[00:00:01] one\n[00:00:02] two\n")
+    client = make_client(sftp)
+    _, offset, head = await client.read_since(LOG_PATH)
+
+    sftp.data = b"[01:00:00] new\n"
+    chunk, new_offset, new_head = await client.read_since(LOG_PATH, offset, head)
+    assert chunk == b"[01:00:00] new\n"
+    assert new_offset == len(sftp.data)
+    assert new_head == sftp.data[:LOG_HEAD_SIG_SIZE]
+    logger.info("Shrunk files are read from the start")
+
+async def check_rotation_by_head_signature():
+    """A file with a different head is a new log even when it is larger"""
+    sftp = FakeSFTP(b"[00:00:01] old log line\n")
+    client = make_client(sftp)
+    _, offset, head = await client.read_since(LOG_PATH)
+
+    sftp.data = b"[02:00:00] rotated log line\n[02:00:01] more\n"
+    assert len(sftp.data) > offset
+    chunk, new_offset, new_head = await client.read_since(LOG_PATH, offset, head)
+    assert chunk == sftp.data
+    assert new_offset == len(sftp.data)
+    assert new_head == sftp.data[:LOG_HEAD_SIG_SIZE]
+
+    # A matching head keeps reading from the offset
+    sftp.data += b"[02:00:02] appended\n"
+    chunk, _, _ = await client.read_since(LOG_PATH, new_offset, new_head)
+    assert chunk == b"[02:00:02] appended\n"
+    logger.info("Rotated files are detected by their head signature")
+
+def test_split_log_entries():
+    entries = split_log_entries("[2024.01.01-00.00.01] Mission started\n\n   \nno timestamp here\n")
+    assert entries == [
+        {'message': "Mission started", 'timestamp': "2024.01.01-00.00.01"},
+        {'message': "no timestamp here", 'timestamp': None},
+    ]
+
+def test_classify_entries():
+    entries = [
+        {'message': "Airdrop incoming", 'timestamp': "t1"},
+        {'message': "Player Bob disconnected", 'timestamp': "t2"},
+        {'message': "Voice call started", 'timestamp': "t3"},
+        {'message': "Heli Crash near connected bunker", 'timestamp': "t4"},
+        {'message': "Nothing to see", 'timestamp': "t5"},
+    ]
+
+    assert classify_entries(entries) == [
+        ('event', {'type': "airdrop", 'message': "Airdrop incoming", 'timestamp': "t1"}),
+        ('connection', {'message': "Player Bob disconnected", 'timestamp': "t2"}),
+        ('event', {'type': "heli crash", 'message': "Heli Crash near connected bunker", 'timestamp': "t4"}),
+        ('connection', {'message': "Heli Crash near connected bunker", 'timestamp': "t4"}),
+    ]
+
+    voice = [kind for kind, _ in classify_entries(entries, voice_enabled=True)]
+    assert voice == ['event', 'connection', 'voice', 'event', 'connection']
+
+def test_read_since_append_and_partial_line():
+    asyncio.run(check_append_and_partial_line())
+
+def test_read_since_shrink():
+    asyncio.run(check_shrink_reads_from_start())
+
+def test_read_since_rotation():
+    asyncio.run(check_rotation_by_head_signature())
+
+if __name__ == "__main__":
+    test_split_log_entries()
+    test_classify_entries()
+    test_read_since_append_and_partial_line()
+    test_read_since_shrink()
+    test_read_since_rotation()
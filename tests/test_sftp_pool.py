@@ -0,0 +1,112 @@
+"""
+Test script for the SFTP client pool
+
+This script checks that idle clients are reused across checkouts of the
+same server key, for clients exposing is_connected as a property (like
+utils.sftp.SFTPClient) and as a method, and that clients failing their
+ping after release are dropped.
+"""
+import asyncio
+import logging
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("test_sftp_pool")
+
+from utils.sftp_pool import SFTPClientPool
+
+class PropertyClient:
+    """Client reporting its connection state through a property"""
+    
+    def __init__(self):
+        self.connected = True
+        
+    @property
+    def is_connected(self):
+        return self.connected
+        
+    async def disconnect(self):
+        self.connected = False
+
+class MethodClient(PropertyClient):
+    """Client reporting its connection state through a method"""
+    
+    def is_connected(self):
+        return self.connected
+
+async def check_same_key_twice(client_class):
+    """Check out the same key twice and expect the idle client back"""
+    pool = SFTPClientPool()
+    created = []
+    
+    async def factory():
+        client = client_class()
+        created.append(client)
+        return client
+    
+    try:
+        async with pool.acquire("guild", "server", factory) as first:
+            pass
+        async with pool.acquire("guild", "server", factory) as second:
+            pass
+        assert second is first, "Idle client should be reused"
+        assert len(created) == 1, "Factory should only run once"
+        
+        # A disconnected idle client is replaced instead of returned
+        first.connected = False
+        async with pool.acquire("guild", "server", factory) as third:
+            pass
+        assert third is not first, "Disconnected client should not be reused"
+        assert len(created) == 2
+    finally:
+        await pool.close()
+    logger.info(f"{client_class.__name__}: same-key checkouts reuse the idle client")
+
+class DeadPingClient(PropertyClient):
+    """Client whose session stopped answering after release"""
+    
+    async def ping(self):
+        return False
+
+async def check_dead_ping_dropped():
+    """A released client that fails its ping is closed, not reused"""
+    pool = SFTPClientPool()
+    created = []
+    
+    async def factory():
+        client = DeadPingClient()
+        created.append(client)
+        return client
+    
+    try:
+        async with pool.acquire("guild", "server", factory) as first:
+            pass
+        # Let the background validation run
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        async with pool.acquire("guild", "server", factory) as second:
+            pass
+        assert second is not first, "Client failing its ping should not be reused"
+        assert not first.connected, "Client failing its ping should be closed"
+    finally:
+        await pool.close()
+    logger.info("Clients failing their ping are dropped from the pool")
+
+def test_checkout_same_key_twice_property():
+    asyncio.run(check_same_key_twice(PropertyClient))
+
+def test_checkout_same_key_twice_method():
+    asyncio.run(check_same_key_twice(MethodClient))
+
+def test_dead_ping_dropped():
+    asyncio.run(check_dead_ping_dropped())
+
+if __name__ == "__main__":
+    test_checkout_same_key_twice_property()
+    test_checkout_same_key_twice_method()
+    test_dead_ping_dropped()
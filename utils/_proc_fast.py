@@ -0,0 +1,142 @@
+"""
+Linux /proc Fast Path
+
+This module reads memory and CPU counters straight from /proc on Linux,
+avoiding the separate open/parse passes psutil performs for each call.
+It is used by utils.system_info when running on Linux.
+"""
+
+import re
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+IS_LINUX = sys.platform.startswith("linux")
+
+# Fields we care about in /proc/meminfo (values are in kB)
+_MEMINFO_RE = re.compile(
+    r"^(MemTotal|MemFree|MemAvailable|Buffers|Cached|SReclaimable|SwapTotal|SwapFree):\s+(\d+)",
+    re.MULTILINE
+)
+
+# Last (busy, total, monotonic time) sample from /proc/stat, used for CPU deltas
+_last_cpu_sample: Optional[Tuple[int, int, float]] = None
+
+# Samples older than this (seconds) are too old to report as current usage
+CPU_SAMPLE_MAX_AGE = 5.0
+
+# Seconds between the two readings taken when there is no recent sample
+CPU_SAMPLE_WINDOW = 0.25
+_cpu_lock = threading.Lock()
+
+
+def _percent(part: int, total: int) -> float:
+    """Return part/total as a percentage rounded like psutil"""
+    if total <= 0:
+        return 0.0
+    return round(part / total * 100, 1)
+
+
+def read_meminfo() -> Dict[str, int]:
+    """
+    Read /proc/meminfo in a single read and parse the fields we need
+
+    Returns:
+        Dict[str, int]: Field name to value in bytes
+    """
+    with open("/proc/meminfo", "rb") as f:
+        data = f.read().decode("ascii", "replace")
+
+    return {name: int(value) * 1024 for name, value in _MEMINFO_RE.findall(data)}
+
+
+def get_memory_info() -> Dict[str, Any]:
+    """
+    Build the same structure as SystemInfo.get_memory_info from /proc/meminfo
+
+    Returns:
+        Dict[str, Any]: Memory information
+    """
+    fields = read_meminfo()
+
+    total = fields.get("MemTotal", 0)
+    free = fields.get("MemFree", 0)
+    cached = fields.get("Cached", 0) + fields.get("SReclaimable", 0)
+    buffers = fields.get("Buffers", 0)
+    available = fields.get("MemAvailable", free + cached + buffers)
+
+    used = total - free - cached - buffers
+    if used < 0:
+        used = total - free
+
+    swap_total = fields.get("SwapTotal", 0)
+    swap_free = fields.get("SwapFree", 0)
+    swap_used = swap_total - swap_free
+
+    return {
+        "virtual_memory": {
+            "total": total,
+            "available": available,
+            "used": used,
+            "free": free,
+            "percent": _percent(total - available, total)
+        },
+        "swap_memory": {
+            "total": swap_total,
+            "used": swap_used,
+            "free": swap_free,
+            "percent": _percent(swap_used, swap_total)
+        }
+    }
+
+
+def _read_cpu_times() -> Tuple[int, int]:
+    """
+    Read the aggregate cpu line from /proc/stat
+
+    Returns:
+        Tuple[int, int]: (busy jiffies, total jiffies)
+    """
+    with open("/proc/stat", "rb") as f:
+        line = f.readline().split()
+
+    # cpu user nice system idle iowait irq softirq steal guest guest_nice
+    # guest/guest_nice are already counted in user/nice
+    values = [int(v) for v in line[1:9]]
+    total = sum(values)
+    idle = values[3] + (values[4] if len(values) > 4 else 0)
+    return total - idle, total
+
+
+def get_cpu_percent() -> float:
+    """
+    Get CPU usage since the previous call
+
+    When the previous sample is missing or older than CPU_SAMPLE_MAX_AGE,
+    a fresh CPU_SAMPLE_WINDOW reading is taken instead, so a long-window
+    average is never reported as current usage.
+
+    Returns:
+        float: CPU usage percentage
+    """
+    global _last_cpu_sample
+
+    busy, total = _read_cpu_times()
+    now = time.monotonic()
+
+    with _cpu_lock:
+        previous = _last_cpu_sample
+        _last_cpu_sample = (busy, total, now)
+
+    if previous is None or now - previous[2] > CPU_SAMPLE_MAX_AGE or total <= previous[1]:
+        time.sleep(CPU_SAMPLE_WINDOW)
+        previous = (busy, total, now)
+        busy, total = _read_cpu_times()
+        with _cpu_lock:
+            _last_cpu_sample = (busy, total, time.monotonic())
+
+        if total <= previous[1]:
+            return 0.0
+
+    return _percent(busy - previous[0], total - previous[1])
@@ -5,101 +5,61 @@ This package provides async/await compatibility helpers for different
 Python and Discord library versions.
 """
 
+from __future__ import annotations
+
 import asyncio
 import functools
-import inspect
+import importlib
 import logging
 import random
-import time
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TypeVar, Coroutine
+from typing import TYPE_CHECKING
 
-# Define BackgroundTask class to avoid circular imports
-class BackgroundTask:
-    """A class to manage background tasks that run asynchronously"""
-    
-    def __init__(self, coro, name=None, loop=None):
-        """Initialize a background task
-        
-        Args:
-            coro: Coroutine to run
-            name: Name of the task (default: None)
-            loop: Event loop to use (default: None)
-        """
-        self.coro = coro
-        self.name = name or "BackgroundTask"
-        self.loop = loop or asyncio.get_event_loop()
-        self.task = None
-        self._running = False
-        self._cancelled = False
-        
-    async def start(self):
-        """Start the background task"""
-        if self._running:
-            return
-            
-        self._running = True
-        self._cancelled = False
-        self.task = asyncio.create_task(self._run())
-        return self.task
-        
-    async def _run(self):
-        """Run the task and handle errors"""
-        try:
-            await self.coro
-        except asyncio.CancelledError:
-            self._cancelled = True
-        except Exception as e:
-            logger.error(f"Error in background task {self.name}: {e}")
-        finally:
-            self._running = False
-            
-    def cancel(self):
-        """Cancel the background task"""
-        if not self._running or not self.task:
-            return
-            
-        self.task.cancel()
-        self._cancelled = True
-        self._running = False
-        
-    @property
-    def running(self):
-        """Check if the task is running"""
-        return self._running
-        
-    @property
-    def cancelled(self):
-        """Check if the task was cancelled"""
-        return self._cancelled
+if TYPE_CHECKING:
+    from typing import Any
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Import async helpers from utils.async_helpers
-from utils.async_helpers import (
-    is_coroutine_function,
-    ensure_async,
-    ensure_sync,
-    safe_gather,
-    safe_wait,
-    AsyncCache,
-    cached_async
-)
-
-# Import type safety functions
-from utils.type_safety import (
-    safe_cast,
-    safe_str,
-    safe_int,
-    safe_float,
-    safe_bool,
-    safe_list,
-    safe_dict,
-    safe_function_call,
-    validate_type,
-    validate_func_args
-)
+# BackgroundTask lives in its own dependency-free module to avoid circular imports
+from utils.async_utils._background import BackgroundTask
+
+# Re-exported helpers, imported from their modules on first access (PEP 562)
+# so importing this package for retryable does not load them
+_LAZY_EXPORTS = {
+    # Async helpers from utils.async_helpers
+    'is_coroutine_function': 'utils.async_helpers',
+    'ensure_async': 'utils.async_helpers',
+    'ensure_sync': 'utils.async_helpers',
+    'safe_gather': 'utils.async_helpers',
+    'safe_wait': 'utils.async_helpers',
+    'AsyncCache': 'utils.async_helpers',
+    'cached_async': 'utils.async_helpers',
+    
+    # Type safety functions from utils.type_safety
+    'safe_cast': 'utils.type_safety',
+    'safe_str': 'utils.type_safety',
+    'safe_int': 'utils.type_safety',
+    'safe_float': 'utils.type_safety',
+    'safe_bool': 'utils.type_safety',
+    'safe_list': 'utils.type_safety',
+    'safe_dict': 'utils.type_safety',
+    'safe_function_call': 'utils.type_safety',
+    'validate_type': 'utils.type_safety',
+    'validate_func_args': 'utils.type_safety',
+}
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported helper on first access and cache it as a global"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include the lazily imported helpers"""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Define retryable decorator here to avoid circular imports
 def retryable(max_retries: int = 3, delay: float = 2.0, backoff: float = 1.5, 
@@ -115,52 +75,42 @@ def retryable(max_retries: int = 3, delay: float = 2.0, backoff: float = 1.5,
     Returns:
         Callable: Decorated function
     """
+    # Support for multiple exception types or single exception, normalized
+    # once so the except clause matches the tuple directly
+    if isinstance(exceptions, (list, tuple)):
+        exc_types = tuple(exceptions)
+    else:
+        exc_types = (exceptions,)
+
+    # Base delay before each retry, known up front
+    schedule = tuple(delay * backoff ** i for i in range(max_retries))
+
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             retries = 0
-            current_delay = delay
 
             while True:
                 try:
                     return await func(*args, **kwargs)
-                except Exception as e:
-                    # Support for multiple exception types or single exception
-                    should_retry = False
-
-                    # Check if we should retry this exception
-                    if isinstance(exceptions, (list, tuple)):
-                        # Multiple exception types
-                        for exc_type in exceptions:
-                            if isinstance(e, exc_type):
-                                should_retry = True
-                                break
-                    else:
-                        # Single exception type
-                        should_retry = isinstance(e, exceptions)
-
-                    if not should_retry:
-                        raise
+                except exc_types as e:
                     retries += 1
                     if retries > max_retries:
                         # Max retries exceeded, re-raise exception
-                        logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}: {e}")
+                        logger.error("Max retries (%d) exceeded for %s: %s", max_retries, func.__name__, e)
                         raise
 
-                    # Add jitter to delay (±20%)
-                    jitter = random.uniform(0.8, 1.2)
-                    wait_time = current_delay * jitter
+                    # Full jitter, so concurrent callers do not retry in lockstep
+                    wait_time = random.uniform(0, schedule[retries - 1])
 
                     logger.warning(
-                        f"Retry {retries}/{max_retries} for {func.__name__} in {wait_time:.2f}s: {e}"
+                        "Retry %d/%d for %s in %.2fs: %s",
+                        retries, max_retries, func.__name__, wait_time, e
                     )
 
                     # Wait before retrying
                     await asyncio.sleep(wait_time)
 
-                    # Increase delay for next retry
-                    current_delay *= backoff
-
         return wrapper
     return decorator
 
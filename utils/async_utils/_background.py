@@ -0,0 +1,70 @@
+"""
+Background Task
+
+This module provides BackgroundTask, re-exported by utils.async_utils.
+It has no imports from the rest of utils, so it can be loaded at any
+point of the package initialization.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BackgroundTask:
+    """A class to manage background tasks that run asynchronously"""
+    
+    def __init__(self, coro, name=None, loop=None):
+        """Initialize a background task
+        
+        Args:
+            coro: Coroutine to run
+            name: Name of the task (default: None)
+            loop: Event loop to use (default: None)
+        """
+        self.coro = coro
+        self.name = name or "BackgroundTask"
+        self.loop = loop or asyncio.get_event_loop()
+        self.task = None
+        self._running = False
+        self._cancelled = False
+        
+    async def start(self):
+        """Start the background task"""
+        if self._running:
+            return
+            
+        self._running = True
+        self._cancelled = False
+        self.task = asyncio.create_task(self._run())
+        return self.task
+        
+    async def _run(self):
+        """Run the task and handle errors"""
+        try:
+            await self.coro
+        except asyncio.CancelledError:
+            self._cancelled = True
+        except Exception as e:
+            logger.error("Error in background task %s: %s", self.name, e)
+        finally:
+            self._running = False
+            
+    def cancel(self):
+        """Cancel the background task"""
+        if not self._running or not self.task:
+            return
+            
+        self.task.cancel()
+        self._cancelled = True
+        self._running = False
+        
+    @property
+    def running(self):
+        """Check if the task is running"""
+        return self._running
+        
+    @property
+    def cancelled(self):
+        """Check if the task was cancelled"""
+        return self._cancelled
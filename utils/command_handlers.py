@@ -6,13 +6,53 @@ compatibility issues between different versions of discord.py and py-cord,
 especially for slash commands and application commands.
 """
 
+import asyncio
+import collections
 import logging
 import inspect
 import functools
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast, get_type_hints
+import importlib
+import importlib.util
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast, get_type_hints
 
-# Import error handler for Step 1.1 fix
-from utils.error_handlers import handle_command_error
+# Error handler for Step 1.1 fix, imported on first use since it is only
+# needed once a command fails
+_handle_command_error = None
+
+def _get_error_handler() -> Callable:
+    """Import utils.error_handlers.handle_command_error on first use."""
+    global _handle_command_error
+    if _handle_command_error is None:
+        from utils.error_handlers import handle_command_error
+        _handle_command_error = handle_command_error
+    return _handle_command_error
+
+def __getattr__(name: str) -> Any:
+    """Keep handle_command_error importable from this module."""
+    if name == "handle_command_error":
+        return _get_error_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Leading X.Y.Z of a version string, ignoring suffixes such as rc1 or .dev0
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+def _resolve_slash_command(candidates):
+    """
+    Get the first available command class from (module, attribute) candidates.
+    
+    Modules are probed with find_spec first, so missing ones are skipped
+    without running the import machinery and raising ImportError.
+    """
+    for module_name, attr in candidates:
+        if importlib.util.find_spec(module_name) is None:
+            continue
+        module = importlib.import_module(module_name)
+        if hasattr(module, attr):
+            return getattr(module, attr)
+    raise ImportError(f"No slash command class found in {[name for name, _ in candidates]}")
 
 try:
     import discord
@@ -31,9 +71,9 @@ try:
     if USING_PYCORD:
         # Check for py-cord 2.6.1+ by version string if available
         try:
-            if hasattr(discord, "__version__"):
-                from packaging import version
-                USING_PYCORD_261_PLUS = version.parse(discord.__version__) >= version.parse("2.6.1")
+            version_match = _VERSION_RE.match(getattr(discord, "__version__", ""))
+            if version_match:
+                USING_PYCORD_261_PLUS = tuple(map(int, version_match.groups())) >= (2, 6, 1)
             else:
                 # Alternative detection method based on module structure
                 USING_PYCORD_261_PLUS = hasattr(discord, "app_commands") and hasattr(discord.app_commands, "command")
@@ -43,33 +83,25 @@ try:
         
         # Import appropriate SlashCommand class based on py-cord version
         if USING_PYCORD_261_PLUS:
-            try:
-                # For py-cord 2.6.1+, create an alias for slash commands
-                # In py-cord 2.6.1+, slash commands are created by slash_command decorator,
-                # not by instantiating a SlashCommand class directly.
-                # We'll use commands.SlashCommand as our base class
-                from discord.ext.commands import Command as SlashCommand
-            except ImportError:
-                # Fallback for different module structures
-                try:
-                    from discord.commands import SlashCommand
-                except ImportError:
-                    # Final fallback to basic Command
-                    from discord.ext.commands import Command as SlashCommand
+            # In py-cord 2.6.1+, slash commands are created by slash_command decorator,
+            # not by instantiating a SlashCommand class directly.
+            # We'll use commands.Command as our base class
+            SlashCommand = _resolve_slash_command((
+                ("discord.ext.commands", "Command"),
+                ("discord.commands", "SlashCommand"),
+            ))
         else:
             # For older py-cord versions
-            try:
-                from discord.commands import SlashCommand
-            except ImportError:
-                # Fallback to base Command class
-                from discord.ext.commands import Command as SlashCommand
+            SlashCommand = _resolve_slash_command((
+                ("discord.commands", "SlashCommand"),
+                ("discord.ext.commands", "Command"),
+            ))
     else:
         # discord.py style
-        try:
-            from discord.app_commands import Command as SlashCommand
-        except ImportError:
-            # Fallback to base Command
-            from discord.ext.commands import Command as SlashCommand
+        SlashCommand = _resolve_slash_command((
+            ("discord.app_commands", "Command"),
+            ("discord.ext.commands", "Command"),
+        ))
         
 except ImportError as e:
     # Provide better error messages for missing dependencies
@@ -83,6 +115,61 @@ except ImportError as e:
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Errors expected while replying with an error message; anything else,
+# including cancellation, propagates
+_ERROR_REPLY_ERRORS = (discord.HTTPException, OSError, asyncio.TimeoutError)
+
+async def _send_error_interaction(ctx, message: str) -> None:
+    """Send an error message as an interaction followup."""
+    await ctx.followup.send(message, ephemeral=True)
+
+async def _send_error_context(ctx, message: str) -> None:
+    """Send an error message through a classic command context."""
+    await ctx.send(message)
+
+async def _send_error_any(ctx, message: str) -> None:
+    """Send an error message, deciding the channel from the context at runtime."""
+    # Handle both interaction and context objects
+    followup = getattr(ctx, 'followup', None)
+    if followup is not None:
+        # It's an interaction
+        await followup.send(message, ephemeral=True)
+        return
+    
+    send = getattr(ctx, 'send', None)
+    if send is not None:
+        # It's a context
+        await send(message)
+
+@functools.lru_cache(maxsize=None)
+def _ctx_annotation(func: Callable) -> Any:
+    """Get the annotation of a command's ctx parameter, cached per function."""
+    try:
+        param = inspect.signature(func).parameters.get('ctx')
+    except (TypeError, ValueError):
+        return None
+    if param is None or param.annotation is inspect.Parameter.empty:
+        return None
+    return param.annotation
+
+def _error_sender(func: Callable) -> Callable:
+    """
+    Pick how a command reports errors from its ctx annotation.
+    
+    Unannotated commands fall back to checking the context at runtime.
+    """
+    annotation = _ctx_annotation(func)
+    if isinstance(annotation, type):
+        interaction_types = tuple(
+            cls for cls in (getattr(discord, 'ApplicationContext', None), getattr(discord, 'Interaction', None))
+            if cls is not None
+        )
+        if interaction_types and issubclass(annotation, interaction_types):
+            return _send_error_interaction
+        if issubclass(annotation, commands.Context):
+            return _send_error_context
+    return _send_error_any
+
 # Define command handler functions that are used by cogs
 def command_handler(
     premium_feature: Optional[str] = None, 
@@ -139,6 +226,9 @@ def command_handler(
         
     def decorator(func):
         """Actual decorator function."""
+        # Resolved once per command instead of on every error
+        send_error = _error_sender(func)
+        
         # Keep the original function intact
         @functools.wraps(func)
         async def wrapped(self, ctx, *args, **kwargs):
@@ -162,7 +252,7 @@ def command_handler(
                             if member:
                                 has_admin_perms = member.guild_permissions.administrator
                     except Exception as e:
-                        logger.error(f"Error checking admin permissions: {e}")
+                        logger.error("Error checking admin permissions: %s", e)
                         
                     # If user doesn't have admin permissions, send error and return
                     if not has_admin_perms:
@@ -181,18 +271,12 @@ def command_handler(
                 # Call the original function
                 return await func(self, ctx, *args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in command {func.__name__}: {e}")
+                logger.error("Error in command %s: %s", func.__name__, e)
                 # Try to respond to the user with an error message
                 try:
-                    # Handle both interaction and context objects
-                    if hasattr(ctx, 'followup'):
-                        # It's an interaction
-                        await ctx.followup.send(f"An error occurred: {e}", ephemeral=True)
-                    elif hasattr(ctx, 'send'):
-                        # It's a context
-                        await ctx.send(f"An error occurred: {e}")
-                except Exception:
-                    logger.error(f"Failed to send error message for {func.__name__}")
+                    await send_error(ctx, f"An error occurred: {e}")
+                except _ERROR_REPLY_ERRORS:
+                    logger.error("Failed to send error message for %s", func.__name__)
                 return None
         
         # Add command handler attributes to the function
@@ -214,7 +298,52 @@ def command_handler(
     return decorator
     
 # Database operation decorator
-DB_OP_METRICS: Dict[str, Dict[str, Any]] = {}
+# Bound once so the db_operation wrapper skips the attribute lookups per call.
+# Durations use the monotonic clock, which never jumps backwards.
+_monotonic = time.monotonic
+_wait_for = asyncio.wait_for
+
+# Upper bound for a single db_operation retry delay in seconds
+DB_RETRY_MAX_DELAY = 10.0
+
+class DbOperationMetrics:
+    """Metrics for one database operation type"""
+    
+    __slots__ = ("calls", "errors", "retries", "timeouts", "avg_duration", "call_times", "sum_duration")
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.avg_duration = 0
+        # Last 100 call times and their running sum
+        self.call_times = collections.deque(maxlen=100)
+        self.sum_duration = 0.0
+
+DB_OP_METRICS: Dict[str, DbOperationMetrics] = {}
+
+def _check_db_attempts(op_type: str, coll_name: str, attempt: int, retry_count: int, last_error: str) -> None:
+    """Raise once a database operation has used up its retries."""
+    # If we've reached max retries, log and raise
+    if attempt > retry_count:
+        logger.error(
+            "Database operation %s on %s failed after %d attempts: %s",
+            op_type, coll_name, attempt, last_error
+        )
+        # Re-raise the last exception
+        raise Exception(f"Database operation failed: {last_error}")
+
+async def _db_retry_wait(op_type: str, coll_name: str, attempt: int, retry_count: int) -> None:
+    """Log a database operation retry and wait before it."""
+    logger.warning(
+        "Retrying database operation %s on %s (attempt %d/%d)",
+        op_type, coll_name, attempt, retry_count
+    )
+    
+    # Wait before retrying with full-jitter exponential backoff so
+    # operations that failed together do not retry in lockstep
+    await asyncio.sleep(random.uniform(0, min(DB_RETRY_MAX_DELAY, 0.5 * (1 << (attempt - 1)))))
 
 def db_operation(
     operation_type: Optional[str] = None,
@@ -246,83 +375,83 @@ def db_operation(
         op_type = operation_type or func.__name__
         coll_name = collection_name or "unknown"
         
-        # Initialize metrics for this operation
+        # The wrapper is specialized here so calls without metrics skip
+        # the bookkeeping entirely
         if log_metrics:
+            # Initialize metrics for this operation
             if op_type not in DB_OP_METRICS:
-                DB_OP_METRICS[op_type] = {
-                    "calls": 0,
-                    "errors": 0,
-                    "retries": 0,
-                    "timeouts": 0,
-                    "avg_duration": 0,
-                    "call_times": [],
-                }
-        
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            import time
-            import asyncio
-            
-            start_time = time.time()
-            attempt = 0
-            last_error = None
+                DB_OP_METRICS[op_type] = DbOperationMetrics()
+            metrics = DB_OP_METRICS[op_type]
             
-            # Try operation with retries
-            while attempt <= retry_count:
-                attempt += 1
+            # DB helpers carry no attributes worth copying, so skip the __dict__ merge
+            @functools.wraps(func, updated=())
+            async def wrapper(*args, **kwargs):
+                start_time = _monotonic()
+                attempt = 0
+                last_error = None
                 
-                try:
-                    # Set timeout for the operation
-                    result = await asyncio.wait_for(
-                        func(*args, **kwargs),
-                        timeout=timeout_seconds
-                    )
+                # Try operation with retries
+                while attempt <= retry_count:
+                    attempt += 1
                     
-                    # Log metrics on success
-                    if log_metrics:
-                        duration = time.time() - start_time
-                        DB_OP_METRICS[op_type]["calls"] += 1
-                        DB_OP_METRICS[op_type]["call_times"].append(duration)
+                    try:
+                        # Set timeout for the operation
+                        result = await _wait_for(
+                            func(*args, **kwargs),
+                            timeout=timeout_seconds
+                        )
+                        
+                        # Log metrics on success
+                        duration = _monotonic() - start_time
+                        metrics.calls += 1
+                        
+                        # The deque drops the oldest call time once full
+                        call_times = metrics.call_times
+                        evicted = call_times[0] if len(call_times) == call_times.maxlen else 0.0
+                        call_times.append(duration)
+                        
+                        # Update the average from the running sum
+                        metrics.sum_duration += duration - evicted
+                        metrics.avg_duration = metrics.sum_duration / len(call_times)
                         
-                        # Keep only the last 100 call times
-                        if len(DB_OP_METRICS[op_type]["call_times"]) > 100:
-                            DB_OP_METRICS[op_type]["call_times"].pop(0)
+                        return result
+                        
+                    except asyncio.TimeoutError:
+                        last_error = f"Database operation timed out after {timeout_seconds}s"
+                        metrics.timeouts += 1
                             
-                        # Recalculate average duration
-                        DB_OP_METRICS[op_type]["avg_duration"] = sum(
-                            DB_OP_METRICS[op_type]["call_times"]
-                        ) / len(DB_OP_METRICS[op_type]["call_times"])
+                    except Exception as e:
+                        last_error = str(e)
+                        metrics.errors += 1
                     
-                    return result
+                    _check_db_attempts(op_type, coll_name, attempt, retry_count, last_error)
                     
-                except asyncio.TimeoutError:
-                    last_error = f"Database operation timed out after {timeout_seconds}s"
-                    if log_metrics:
-                        DB_OP_METRICS[op_type]["timeouts"] += 1
-                        
-                except Exception as e:
-                    last_error = str(e)
-                    if log_metrics:
-                        DB_OP_METRICS[op_type]["errors"] += 1
-                
-                # If we've reached max retries, log and raise
-                if attempt > retry_count:
-                    logger.error(
-                        f"Database operation {op_type} on {coll_name} failed after {attempt} attempts: {last_error}"
-                    )
-                    # Re-raise the last exception
-                    raise Exception(f"Database operation failed: {last_error}")
-                
-                # Log retry attempt
-                if log_metrics:
-                    DB_OP_METRICS[op_type]["retries"] += 1
-                
-                logger.warning(
-                    f"Retrying database operation {op_type} on {coll_name} (attempt {attempt}/{retry_count})"
-                )
+                    # Log retry attempt
+                    metrics.retries += 1
+                    await _db_retry_wait(op_type, coll_name, attempt, retry_count)
+        else:
+            @functools.wraps(func, updated=())
+            async def wrapper(*args, **kwargs):
+                attempt = 0
+                last_error = None
                 
-                # Wait before retrying with exponential backoff
-                await asyncio.sleep(0.5 * (2 ** (attempt - 1)))
+                # Try operation with retries
+                while attempt <= retry_count:
+                    attempt += 1
+                    
+                    try:
+                        # Set timeout for the operation
+                        return await _wait_for(
+                            func(*args, **kwargs),
+                            timeout=timeout_seconds
+                        )
+                    except asyncio.TimeoutError:
+                        last_error = f"Database operation timed out after {timeout_seconds}s"
+                    except Exception as e:
+                        last_error = str(e)
+                    
+                    _check_db_attempts(op_type, coll_name, attempt, retry_count, last_error)
+                    await _db_retry_wait(op_type, coll_name, attempt, retry_count)
         
         # Store metadata on the function for introspection
         wrapper.operation_type = op_type
@@ -357,23 +486,21 @@ def upgrade_command_handler(
                 return await func(self, ctx, *args, **kwargs)
             except Exception as e:
                 # Use handle_command_error from error_handlers
-                await handle_command_error(ctx, e)
-                logger.error(f"Error in command {func.__name__}: {e}", exc_info=True)
+                await _get_error_handler()(ctx, e)
+                logger.error("Error in command %s: %s", func.__name__, e, exc_info=True)
         wrapper = default_wrapper
         
     # Copy options to the wrapper
     for key, value in kwargs.items():
         setattr(wrapper, key, value)
         
-    # Also copy any existing attributes from func
-    for key in dir(func):
-        if key.startswith('__'):
-            continue
-        try:
-            if not hasattr(wrapper, key):
-                setattr(wrapper, key, getattr(func, key))
-        except (AttributeError, TypeError):
-            pass
+    # Also copy any existing attributes from func. Only attributes set on
+    # the function itself are copied, read straight from its __dict__
+    wrapper_attrs = getattr(wrapper, '__dict__', None)
+    if wrapper_attrs is not None:
+        for key, value in getattr(func, '__dict__', {}).items():
+            if not key.startswith('__') and key not in wrapper_attrs:
+                wrapper_attrs[key] = value
             
     return wrapper
     
@@ -390,65 +517,71 @@ def defer_interaction():
 T = TypeVar('T')
 CommandT = TypeVar('CommandT')
 
+# Command parameters that are never slash command options
+_SKIP_PARAMS = frozenset(("self", "ctx"))
+
+# Marker for a parameter without a default or annotation
+_EMPTY = inspect.Parameter.empty
+
 class EnhancedSlashCommand(SlashCommand):
     """
     Enhanced SlashCommand with compatibility fixes for different py-cord versions.
     
     This class overrides the _parse_options method to handle both list-style options
     (used in newer py-cord versions) and dict-style options (used in older versions).
+    The matching parser is bound to _parse_options when the class is created.
     """
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._parameter_descriptions = {}
         
-    def _parse_options(self, params: Dict[str, Any]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    def _parse_options_list(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Parse command options with compatibility for different parameter styles.
+        Parse command options as a list (py-cord 2.6.1+ style).
         
         Args:
             params: Parameter dictionary
             
         Returns:
-            Either a dict (older style) or list (newer style) of option parameters
+            List of option parameters
         """
-        # If we're using py-cord 2.6.1+, we need to handle the options differently
-        if USING_PYCORD_261_PLUS:
-            try:
-                # Newer py-cord expects a list of options
-                options = []
-                
-                # Extract the parameters
-                for name, param in params.items():
-                    if name == "self" or name == "ctx":
-                        continue
-                        
-                    option = self._extract_option_params(name, param)
-                    options.append(option)
-                    
-                return options
-            except Exception as e:
-                logger.error(f"Error parsing options in newer py-cord style: {e}")
-                # Fall back to super's implementation
-                return super()._parse_options(params)  # type: ignore
-        else:
+        try:
+            # Newer py-cord expects a list of options
+            return [
+                self._extract_option_params(name, param)
+                for name, param in params.items()
+                if name not in _SKIP_PARAMS
+            ]
+        except Exception as e:
+            logger.error("Error parsing options in newer py-cord style: %s", e)
+            # Fall back to super's implementation
+            return super()._parse_options(params)  # type: ignore
+            
+    def _parse_options_dict(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse command options as a dict (older py-cord and discord.py style).
+        
+        Args:
+            params: Parameter dictionary
+            
+        Returns:
+            Dict of option parameters keyed by name
+        """
+        try:
             # Older py-cord or discord.py expects a dict of options
-            try:
-                options = {}
-                
-                # Extract the parameters
-                for name, param in params.items():
-                    if name == "self" or name == "ctx":
-                        continue
-                        
-                    option = self._extract_option_params(name, param)
-                    options[name] = option
-                    
-                return options
-            except Exception as e:
-                logger.error(f"Error parsing options in older py-cord style: {e}")
-                # Fall back to super's implementation
-                return super()._parse_options(params)  # type: ignore
+            return {
+                name: self._extract_option_params(name, param)
+                for name, param in params.items()
+                if name not in _SKIP_PARAMS
+            }
+        except Exception as e:
+            logger.error("Error parsing options in older py-cord style: %s", e)
+            # Fall back to super's implementation
+            return super()._parse_options(params)  # type: ignore
+            
+    # The py-cord version is fixed at import, so pick the parser once
+    _parse_options = _parse_options_list if USING_PYCORD_261_PLUS else _parse_options_dict
                 
     def _extract_option_params(self, name: str, param: Any) -> Dict[str, Any]:
         """
@@ -461,20 +594,22 @@ class EnhancedSlashCommand(SlashCommand):
         Returns:
             Dict of option parameters
         """
+        default = param.default
+        annotation = param.annotation
+        
         option = {
             "name": name,
             "description": self._parameter_descriptions.get(name, "No description provided"),
-            "required": True,
+            "required": default is _EMPTY,
         }
         
         # Set default if available
-        if param.default is not inspect.Parameter.empty:
-            option["required"] = False
-            option["default"] = param.default
+        if default is not _EMPTY:
+            option["default"] = default
             
         # Set type if available
-        if param.annotation is not inspect.Parameter.empty:
-            option["type"] = param.annotation
+        if annotation is not _EMPTY:
+            option["type"] = annotation
             
         return option
         
@@ -488,7 +623,33 @@ class EnhancedSlashCommand(SlashCommand):
         """
         self._parameter_descriptions[name] = description
 
-# Parameter option builders
+# Parameter option builders. Each fills a copy of a per-type template
+# built once at import
+def _option_template(option_type: Any) -> Dict[str, Any]:
+    """Create the template dict for an option type."""
+    return {"name": None, "description": None, "required": True, "type": option_type}
+
+_TEXT_OPTION_TEMPLATE = _option_template(str)
+_NUMBER_OPTION_TEMPLATE = _option_template(float)
+_INTEGER_OPTION_TEMPLATE = _option_template(int)
+_BOOLEAN_OPTION_TEMPLATE = _option_template(bool)
+_USER_OPTION_TEMPLATE = _option_template(discord.User)
+_CHANNEL_OPTION_TEMPLATE = _option_template(discord.abc.GuildChannel)
+_ROLE_OPTION_TEMPLATE = _option_template(discord.Role)
+
+def _build_option(template: Dict[str, Any], name: str, description: str, required: bool,
+                  default: Any = None) -> Dict[str, Any]:
+    """Fill a copy of an option template."""
+    option = template.copy()
+    option["name"] = name
+    option["description"] = description
+    option["required"] = required
+    
+    if default is not None:
+        option["default"] = default
+        
+    return option
+
 def text_option(name: str, description: str, required: bool = True, default: str = None) -> Dict[str, Any]:
     """
     Create a text option for a slash command.
@@ -502,17 +663,7 @@ def text_option(name: str, description: str, required: bool = True, default: str
     Returns:
         Option dictionary
     """
-    option = {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": str,
-    }
-    
-    if default is not None:
-        option["default"] = default
-        
-    return option
+    return _build_option(_TEXT_OPTION_TEMPLATE, name, description, required, default)
 
 def number_option(name: str, description: str, required: bool = True, default: float = None) -> Dict[str, Any]:
     """
@@ -527,17 +678,7 @@ def number_option(name: str, description: str, required: bool = True, default: f
     Returns:
         Option dictionary
     """
-    option = {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": float,
-    }
-    
-    if default is not None:
-        option["default"] = default
-        
-    return option
+    return _build_option(_NUMBER_OPTION_TEMPLATE, name, description, required, default)
 
 def integer_option(name: str, description: str, required: bool = True, default: int = None) -> Dict[str, Any]:
     """
@@ -552,17 +693,7 @@ def integer_option(name: str, description: str, required: bool = True, default:
     Returns:
         Option dictionary
     """
-    option = {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": int,
-    }
-    
-    if default is not None:
-        option["default"] = default
-        
-    return option
+    return _build_option(_INTEGER_OPTION_TEMPLATE, name, description, required, default)
 
 def boolean_option(name: str, description: str, required: bool = True, default: bool = None) -> Dict[str, Any]:
     """
@@ -577,17 +708,7 @@ def boolean_option(name: str, description: str, required: bool = True, default:
     Returns:
         Option dictionary
     """
-    option = {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": bool,
-    }
-    
-    if default is not None:
-        option["default"] = default
-        
-    return option
+    return _build_option(_BOOLEAN_OPTION_TEMPLATE, name, description, required, default)
 
 def user_option(name: str, description: str, required: bool = True) -> Dict[str, Any]:
     """
@@ -601,12 +722,7 @@ def user_option(name: str, description: str, required: bool = True) -> Dict[str,
     Returns:
         Option dictionary
     """
-    return {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": discord.User,
-    }
+    return _build_option(_USER_OPTION_TEMPLATE, name, description, required)
 
 def channel_option(name: str, description: str, required: bool = True) -> Dict[str, Any]:
     """
@@ -620,12 +736,7 @@ def channel_option(name: str, description: str, required: bool = True) -> Dict[s
     Returns:
         Option dictionary
     """
-    return {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": discord.abc.GuildChannel,
-    }
+    return _build_option(_CHANNEL_OPTION_TEMPLATE, name, description, required)
 
 def role_option(name: str, description: str, required: bool = True) -> Dict[str, Any]:
     """
@@ -639,12 +750,7 @@ def role_option(name: str, description: str, required: bool = True) -> Dict[str,
     Returns:
         Option dictionary
     """
-    return {
-        "name": name,
-        "description": description,
-        "required": required,
-        "type": discord.Role,
-    }
+    return _build_option(_ROLE_OPTION_TEMPLATE, name, description, required)
 
 def enhanced_slash_command(
     name: Optional[str] = None,
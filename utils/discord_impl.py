@@ -14,7 +14,10 @@ import platform
 import random
 import sys
 import time
+from collections import namedtuple
 from enum import Enum, IntEnum, auto
+from functools import lru_cache
+from itertools import count
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
@@ -23,75 +26,83 @@ logger = logging.getLogger(__name__)
 __version__ = "2.6.1.impl"
 version_info = (2, 6, 1)
 
+# Object IDs only need to be unique within this process
+_next_id = count(1).__next__
+
+# Intent flag names accepted by Intents(), and the gateway bit each
+# validated flag contributes to Intents.value
+_INTENT_FLAGS = (
+    'members', 'presences', 'message_content', 'guilds', 'guild_messages',
+    'dm_messages', 'guild_reactions', 'dm_reactions', 'guild_typing',
+    'dm_typing', 'emojis', 'integrations', 'webhooks', 'invites',
+    'voice_states', 'scheduled_events',
+)
+_INTENT_BITS = (
+    ('guilds', 1 << 0),
+    ('members', 1 << 1),
+    ('emojis', 1 << 2),
+    ('guild_messages', 1 << 7),
+    ('guild_reactions', 1 << 9),
+    ('dm_messages', 1 << 12),
+    ('dm_reactions', 1 << 14),
+    ('message_content', 1 << 15),
+)
+
+def _intent_value(flags):
+    """Compute the intents bitmask for a flag mapping"""
+    value = 0
+    for name, bit in _INTENT_BITS:
+        if flags[name]:
+            value |= bit
+    return value
+
+def _intent_preset(**enabled):
+    """Build the full attribute dict (flags plus value) for an Intents preset"""
+    flags = dict.fromkeys(_INTENT_FLAGS, False)
+    flags.update(enabled)
+    flags['value'] = _intent_value(flags)
+    return flags
+
+_NO_INTENTS = _intent_preset()
+_ALL_INTENTS = _intent_preset(**dict.fromkeys(_INTENT_FLAGS, True))
+_DEFAULT_INTENTS = _intent_preset(guilds=True, guild_messages=True, dm_messages=True)
+
 # Create a minimal Discord implementation that doesn't rely on the real Discord library
 class Intents:
     """Implementation of Discord Intents class"""
     
     def __init__(self, **kwargs):
-        self.members = kwargs.get('members', False)
-        self.presences = kwargs.get('presences', False)
-        self.message_content = kwargs.get('message_content', False)
-        self.guilds = kwargs.get('guilds', False)
-        self.guild_messages = kwargs.get('guild_messages', False)
-        self.dm_messages = kwargs.get('dm_messages', False)
-        self.guild_reactions = kwargs.get('guild_reactions', False)
-        self.dm_reactions = kwargs.get('dm_reactions', False)
-        self.guild_typing = kwargs.get('guild_typing', False)
-        self.dm_typing = kwargs.get('dm_typing', False)
-        self.emojis = kwargs.get('emojis', False)
-        self.integrations = kwargs.get('integrations', False)
-        self.webhooks = kwargs.get('webhooks', False)
-        self.invites = kwargs.get('invites', False)
-        self.voice_states = kwargs.get('voice_states', False)
-        self.scheduled_events = kwargs.get('scheduled_events', False)
+        flags = dict.fromkeys(_INTENT_FLAGS, False)
+        for name, enabled in kwargs.items():
+            if name in flags:
+                flags[name] = enabled
+        self.__dict__.update(flags)
         
         # For validation
-        self.value = sum([
-            (1 << 0) if self.guilds else 0,
-            (1 << 1) if self.members else 0,
-            (1 << 2) if self.emojis else 0,
-            (1 << 7) if self.guild_messages else 0,
-            (1 << 9) if self.guild_reactions else 0,
-            (1 << 12) if self.dm_messages else 0,
-            (1 << 14) if self.dm_reactions else 0,
-            (1 << 15) if self.message_content else 0,
-        ])
+        self.value = _intent_value(flags)
+        
+    @classmethod
+    def _from_preset(cls, preset):
+        # Presets are copied rather than shared: callers routinely tweak the
+        # returned object (intents.members = True) before handing it to a bot
+        intents = cls.__new__(cls)
+        intents.__dict__.update(preset)
+        return intents
         
     @classmethod
     def all(cls):
         """Return intents with all flags enabled"""
-        return cls(
-            members=True,
-            presences=True,
-            message_content=True,
-            guilds=True,
-            guild_messages=True,
-            dm_messages=True,
-            guild_reactions=True,
-            dm_reactions=True,
-            guild_typing=True,
-            dm_typing=True,
-            emojis=True,
-            integrations=True,
-            webhooks=True,
-            invites=True,
-            voice_states=True,
-            scheduled_events=True
-        )
+        return cls._from_preset(_ALL_INTENTS)
         
     @classmethod
     def default(cls):
         """Return default intents"""
-        return cls(
-            guilds=True,
-            guild_messages=True,
-            dm_messages=True
-        )
+        return cls._from_preset(_DEFAULT_INTENTS)
         
     @classmethod
     def none(cls):
         """Return intents with no flags enabled"""
-        return cls()
+        return cls._from_preset(_NO_INTENTS)
 
 class ChannelType(IntEnum):
     """Discord Channel Types"""
@@ -136,9 +147,14 @@ class Color:
     def __init__(self, value):
         self.value = value
         
+    @staticmethod
+    def _rgb(r, g, b):
+        """Pack 8-bit channels into a 0xRRGGBB integer"""
+        return _pack_rgb(r, g, b)
+        
     @classmethod
     def from_rgb(cls, r, g, b):
-        return cls((r << 16) + (g << 8) + b)
+        return cls(cls._rgb(r, g, b))
         
     @classmethod
     def default(cls):
@@ -156,6 +172,13 @@ class Color:
     white = 0xFFFFFF
     black = 0x000000
 
+# Repeated from_rgb() calls use the same few channels (config and embed
+# colors). Only the packed int is cached: Color.value is writable, so each
+# call still gets its own instance
+@lru_cache(maxsize=64)
+def _pack_rgb(r, g, b):
+    return (r & 0xFF) << 16 | (g & 0xFF) << 8 | (b & 0xFF)
+
 # Database helpers
 class SafeMongoDBResult:
     """Safe MongoDB Result Wrapper"""
@@ -207,6 +230,22 @@ async def connect_mongodb(connection_string, database_name="discord_bot"):
     except ImportError:
         return None, "MongoDB libraries not installed (pymongo, motor)"
 
+def _scan_event_names(cls):
+    """Return the names of the on_* handlers defined on cls or its bases
+    
+    Only the class dicts are inspected, so properties such as Bot.db are
+    never evaluated.
+    """
+    names = []
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name not in seen:
+                seen.add(name)
+                if name.startswith('on_') and callable(attr):
+                    names.append(name)
+    return tuple(names)
+
 # Basic Bot implementations
 class Bot:
     """Discord Bot base implementation for compatibility with py-cord"""
@@ -216,7 +255,7 @@ class Bot:
         self.intents = intents if intents else Intents.default()
         self.options = options
         self.user = None
-        self.loop = asyncio.get_event_loop()
+        self._loop = None
         self.commands = {}
         self.event_listeners = {}
         self.background_tasks = {}
@@ -224,12 +263,79 @@ class Bot:
         self._db = None
         self._db_client = None
         self._ready = asyncio.Event()
+        self._shutdown_event = None
         
         # Auto-register event handlers from subclasses
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if method_name.startswith('on_') and callable(method):
-                self.event_listeners[method_name] = method
+        for method_name in self._event_names:
+            self.event_listeners[method_name] = getattr(self, method_name)
+    
+    @property
+    def command_prefix(self):
+        """Prefix (str, iterable of str, or callable) that commands start with"""
+        return self._command_prefix
+    
+    @command_prefix.setter
+    def command_prefix(self, value):
+        self._command_prefix = value
+        self._init_prefix_matcher()
+    
+    def _init_prefix_matcher(self):
+        """Pick the prefix matcher suited to the type of command_prefix"""
+        prefix = self.command_prefix
+        if isinstance(prefix, str):
+            self._prefix = prefix
+            self._prefix_len = len(prefix)
+            self._match_prefix = self._match_str_prefix
+        elif callable(prefix):
+            self._match_prefix = self._match_callable_prefix
+        else:
+            # Longest first, so that '!!' is tried before '!'
+            self._prefixes = tuple(sorted(prefix, key=len, reverse=True))
+            self._match_prefix = self._match_tuple_prefix
+    
+    def _match_str_prefix(self, message):
+        """Return the prefix length if the message starts with it, else None"""
+        if message.content.startswith(self._prefix):
+            return self._prefix_len
+        return None
+    
+    def _match_tuple_prefix(self, message):
+        """Return the length of the longest matching prefix, else None"""
+        content = message.content
+        for prefix in self._prefixes:
+            if content.startswith(prefix):
+                return len(prefix)
+        return None
+    
+    def _match_callable_prefix(self, message):
+        """Resolve the prefixes for this message and match the longest one"""
+        prefixes = self.command_prefix(self, message)
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        content = message.content
+        for prefix in sorted(prefixes, key=len, reverse=True):
+            if content.startswith(prefix):
+                return len(prefix)
+        return None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._event_names = _scan_event_names(cls)
+    
+    async def _dispatch(self, event_name, *args):
+        """Call the registered listener for event_name, if there is one"""
+        listener = self.event_listeners.get(event_name)
+        if listener is not None:
+            await listener(*args)
+    
+    @property
+    def loop(self):
+        """Event loop the bot runs on, bound when start() is called"""
+        return self._loop or asyncio.get_running_loop()
+    
+    @loop.setter
+    def loop(self, value):
+        self._loop = value
     
     @property
     def db(self):
@@ -292,16 +398,22 @@ class Bot:
         cog.bot = self
         self._cogs[cog.__class__.__name__] = cog
         
+        # Cog subclasses record their commands and listeners at class
+        # creation; anything else falls back to scanning its attributes
+        cog_type = type(cog)
+        command_names = getattr(cog_type, '__cog_commands__', None)
+        if command_names is None:
+            command_names, listener_names, _ = _scan_cog_attributes(cog_type)
+        else:
+            listener_names = cog_type.__cog_listeners__
+        
         # Register all commands
-        for cmd_name in dir(cog):
-            cmd = getattr(cog, cmd_name)
-            if isinstance(cmd, Command):
-                self.add_command(cmd)
+        for cmd_name in command_names:
+            self.add_command(getattr(cog, cmd_name))
         
         # Register all event listeners
-        for method_name in dir(cog):
-            if method_name.startswith('on_') and callable(getattr(cog, method_name)):
-                self.event_listeners[method_name] = getattr(cog, method_name)
+        for method_name in listener_names:
+            self.event_listeners[method_name] = getattr(cog, method_name)
                 
         # Setup method
         if hasattr(cog, 'cog_load') and callable(cog.cog_load):
@@ -316,30 +428,38 @@ class Bot:
         if name:
             self.background_tasks[name] = task
             
-        def task_done(t):
-            if t.exception() is not None:
-                logger.error(f"Task {name} failed with exception: {t.exception()}")
-            if name in self.background_tasks:
-                del self.background_tasks[name]
-                
-        task.add_done_callback(task_done)
+        task.add_done_callback(self._on_task_done)
         return task
     
+    def _on_task_done(self, task):
+        """Log a failed background task and stop tracking it"""
+        name = task.get_name()
+        if not task.cancelled():
+            exc = task.exception()
+            if exc is not None:
+                logger.error(f"Task {name} failed with exception: {exc}")
+        # A newer task may have been registered under the same name
+        if self.background_tasks.get(name) is task:
+            del self.background_tasks[name]
+    
     async def process_commands(self, message):
         """Process commands from a message"""
         if message.author.bot:
             return
             
-        content = message.content
-        if not content.startswith(self.command_prefix):
+        prefix_len = self._match_prefix(message)
+        if prefix_len is None:
             return
             
-        parts = content[len(self.command_prefix):].split()
+        # Split off the command name only; the arguments are tokenised once
+        # the name is known to belong to a command
+        parts = message.content[prefix_len:].split(None, 1)
+        if not parts:
+            return
         command_name = parts[0]
-        args = parts[1:]
-        
-        if command_name in self.commands:
-            command = self.commands[command_name]
+        command = self.commands.get(command_name)
+        if command is not None:
+            args = parts[1].split() if len(parts) > 1 else ()
             ctx = Context(self, message)
             try:
                 await command.invoke(ctx, *args)
@@ -365,25 +485,25 @@ class Bot:
         """Start the bot connection"""
         try:
             logger.info("Starting bot connection...")
+            self._loop = asyncio.get_running_loop()
+            self._shutdown_event = asyncio.Event()
             
             # Create a fake user for the bot
-            self.user = User(id=random.randint(10000, 99999), 
+            self.user = User(id=_next_id(), 
                             name="BotUser", 
                             discriminator="0000", 
                             bot=True)
                             
             # Fire the ready event
             logger.info("Firing on_ready event...")
-            if 'on_ready' in self.event_listeners:
-                try:
-                    await self.event_listeners['on_ready']()
-                except Exception as e:
-                    logger.error(f"Error in on_ready event: {str(e)}")
+            try:
+                await self._dispatch('on_ready')
+            except Exception as e:
+                logger.error(f"Error in on_ready event: {str(e)}")
             
-            # Keep the bot running 
+            # Keep the bot running until close() is called
             logger.info("Bot is now running. Press CTRL+C to stop.")
-            while True:
-                await asyncio.sleep(1)
+            await self._shutdown_event.wait()
                 
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
@@ -396,6 +516,10 @@ class Bot:
         """Close the bot connection and cleanup"""
         logger.info("Shutting down bot...")
         
+        # Release start() if it is still waiting
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+            
         # Cancel all background tasks
         for name, task in self.background_tasks.items():
             if not task.done():
@@ -409,6 +533,8 @@ class Bot:
             
         logger.info("Bot has been shut down.")
 
+Bot._event_names = _scan_event_names(Bot)
+
 # Command helpers
 class Command:
     """Command implementation for compatibility"""
@@ -441,6 +567,8 @@ class Command:
 class Context:
     """Command context implementation"""
     
+    __slots__ = ('bot', 'message', 'author', 'channel', 'guild')
+    
     def __init__(self, bot, message):
         self.bot = bot
         self.message = message
@@ -459,34 +587,35 @@ class Context:
 class User:
     """Discord User implementation"""
     
+    __slots__ = ('id', 'name', 'discriminator', 'bot', 'display_name', 'mention', '_str')
+    
     def __init__(self, id, name, discriminator="0000", bot=False):
         self.id = id
         self.name = name
         self.discriminator = discriminator
         self.bot = bot
         self.display_name = name
-        
-    @property
-    def mention(self):
-        return f"<@{self.id}>"
+        self.mention = f"<@{id}>"
+        self._str = f"{name}#{discriminator}"
         
     def __str__(self):
-        return f"{self.name}#{self.discriminator}"
+        return self._str
 
 class Member(User):
     """Discord Member implementation (user + guild info)"""
     
+    __slots__ = ('guild', 'roles')
+    
     def __init__(self, id, name, guild, discriminator="0000", roles=None, bot=False):
         super().__init__(id, name, discriminator, bot)
         self.guild = guild
         self.roles = roles or []
-        
-    def __str__(self):
-        return f"{self.name}#{self.discriminator}"
 
 class Message:
     """Discord Message implementation"""
     
+    __slots__ = ('id', 'content', 'author', 'channel', 'guild', 'created_at')
+    
     def __init__(self, id, content, author, channel, guild=None):
         self.id = id
         self.content = content
@@ -499,7 +628,7 @@ class Message:
         """Reply to the message"""
         logger.info(f"[Reply] to {self.author.name}: {content}")
         msg = Message(
-            id=random.randint(10000, 99999),
+            id=_next_id(),
             content=content,
             author=User(0, "Bot", bot=True),
             channel=self.channel
@@ -513,14 +642,13 @@ class Message:
 class Channel:
     """Base Discord Channel implementation"""
     
+    __slots__ = ('id', 'name', 'type', 'mention')
+    
     def __init__(self, id, name, type=None):
         self.id = id
         self.name = name
         self.type = type or ChannelType.TEXT
-        
-    @property
-    def mention(self):
-        return f"<#{self.id}>"
+        self.mention = f"<#{id}>"
         
     def __str__(self):
         return self.name
@@ -528,6 +656,8 @@ class Channel:
 class TextChannel(Channel):
     """Discord Text Channel implementation"""
     
+    __slots__ = ('guild',)
+    
     def __init__(self, id, name, guild=None):
         super().__init__(id, name, ChannelType.TEXT)
         self.guild = guild
@@ -536,7 +666,7 @@ class TextChannel(Channel):
         """Send a message to the channel"""
         logger.info(f"[Message] to #{self.name}: {content}")
         msg = Message(
-            id=random.randint(10000, 99999),
+            id=_next_id(),
             content=content,
             author=User(0, "Bot", bot=True),
             channel=self
@@ -546,6 +676,8 @@ class TextChannel(Channel):
 class Guild:
     """Discord Guild (server) implementation"""
     
+    __slots__ = ('id', 'name', 'owner_id', 'channels', 'members', 'roles')
+    
     def __init__(self, id, name, owner_id=None):
         self.id = id
         self.name = name
@@ -560,23 +692,28 @@ class Guild:
 class Role:
     """Discord Role implementation"""
     
+    __slots__ = ('id', 'name', 'guild', 'color', 'permissions', 'mention')
+    
     def __init__(self, id, name, guild, color=0, permissions=0):
         self.id = id
         self.name = name
         self.guild = guild
         self.color = color
         self.permissions = permissions
-        
-    @property
-    def mention(self):
-        return f"<@&{self.id}>"
+        self.mention = f"<@&{id}>"
         
     def __str__(self):
         return self.name
 
+# Embed fields are read by attribute (field.name), as with discord.py's EmbedProxy
+_Field = namedtuple('_Field', 'name value inline')
+
 class Embed:
     """Discord Embed implementation"""
     
+    __slots__ = ('title', 'description', 'color', 'url', 'timestamp', 'fields',
+                 'footer', 'image', 'thumbnail', 'author')
+    
     def __init__(self, **kwargs):
         self.title = kwargs.get('title')
         self.description = kwargs.get('description')
@@ -591,11 +728,7 @@ class Embed:
         
     def add_field(self, name, value, inline=False):
         """Add a field to the embed"""
-        self.fields.append({
-            'name': name,
-            'value': value,
-            'inline': inline
-        })
+        self.fields.append(_Field(name, value, inline))
         return self
         
     def set_footer(self, text, icon_url=None):
@@ -625,6 +758,49 @@ class Embed:
         }
         return self
 
+def _scan_cog_attributes(cls):
+    """Collect the command, listener and slash command attribute names of a cog class
+    
+    Returns three tuples: command attribute names, on_* listener names, and
+    (slash command name, attribute name) pairs. Names defined closer to cls
+    in the MRO shadow those of its bases.
+    """
+    commands = []
+    listeners = []
+    slash_commands = []
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(attr, Command):
+                commands.append(name)
+            elif name.startswith('on_') and callable(attr):
+                listeners.append(name)
+            if getattr(attr, '__slash_command__', False):
+                slash_commands.append((getattr(attr, '__slash_command_name__', name), name))
+    return tuple(commands), tuple(listeners), tuple(slash_commands)
+
+class Cog:
+    """Base class for Cogs"""
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        (cls.__cog_commands__,
+         cls.__cog_listeners__,
+         cls.__cog_slash_commands__) = _scan_cog_attributes(cls)
+        
+    def __init__(self):
+        self.bot = None
+        
+    def cog_load(self):
+        """Called when the cog is loaded"""
+        pass
+        
+    def cog_unload(self):
+        """Called when the cog is unloaded"""
+        pass
+
 # Errors and exceptions
 class CommandError(Exception):
     """Base command error"""
@@ -665,32 +841,21 @@ class _ExtCommands:
     MissingPermissions = MissingPermissions
     CommandNotFound = CommandNotFound
     CommandOnCooldown = CommandOnCooldown
+    Cog = Cog
     
     def __init__(self):
         # Command decorators
         self.command = Bot.command
-        
-        # Define a Cog base class
-        class Cog:
-            """Base class for Cogs"""
-            def __init__(self):
-                self.bot = None
-                
-            def cog_load(self):
-                """Called when the cog is loaded"""
-                pass
-                
-            def cog_unload(self):
-                """Called when the cog is unloaded"""
-                pass
-                
-        self.Cog = Cog
 
 # Create namespaces
 ext = type('ext', (), {})
 ext.commands = _ExtCommands()
 
-# Make imports work
-sys.modules['discord'] = sys.modules[__name__]  
-sys.modules['discord.ext'] = ext
-sys.modules['discord.ext.commands'] = ext.commands
\ No newline at end of file
+# Make imports work, without replacing a real discord library that is
+# already loaded
+_loaded_discord = sys.modules.get('discord')
+if _loaded_discord is None or getattr(_loaded_discord, '__version__', None) == __version__:
+    sys.modules.setdefault('discord', sys.modules[__name__])
+    sys.modules.setdefault('discord.ext', ext)
+    sys.modules.setdefault('discord.ext.commands', ext.commands)
+del _loaded_discord
@@ -21,6 +21,15 @@ logger.info(f"Loading Discord compatibility layer (version {__version__})")
 class Intents:
     """Discord Intents implementation"""
     
+    # Gateway bit contributed to value by each validated flag
+    _BITS = {
+        'guilds': 1 << 0,
+        'members': 1 << 1,
+        'guild_messages': 1 << 7,
+        'guild_reactions': 1 << 9,
+        'message_content': 1 << 15,
+    }
+    
     def __init__(self, **kwargs):
         self.members = kwargs.get('members', False)
         self.presences = kwargs.get('presences', False)
@@ -32,13 +41,11 @@ class Intents:
         self.dm_reactions = kwargs.get('dm_reactions', False)
         
         # For validation
-        self.value = sum([
-            (1 << 0) if self.guilds else 0,
-            (1 << 1) if self.members else 0,
-            (1 << 9) if self.guild_reactions else 0,
-            (1 << 7) if self.guild_messages else 0,
-            (1 << 15) if self.message_content else 0,
-        ])
+        value = 0
+        for flag, bit in self._BITS.items():
+            if getattr(self, flag):
+                value |= bit
+        self.value = value
         
     @classmethod
     def all(cls):
@@ -5,11 +5,14 @@ This module provides a set of classes and functions that mimic the
 discord.app_commands module from py-cord 2.6.1.
 """
 
+import functools
 import inspect
 import logging
 from enum import IntEnum
 from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
 
+from utils.discord_original import Message, User
+
 logger = logging.getLogger(__name__)
 
 # Slash command option types
@@ -42,8 +45,12 @@ class CommandInteraction:
         self.channel = channel
         self.response = CommandResponse(self)
         
-    async def response_send(self, content=None, **kwargs):
-        """Send a response to the interaction"""
+    def response_send(self, content=None, **kwargs):
+        """Send a response to the interaction
+        
+        Returns the send_message coroutine directly; awaiting it yields the
+        response message.
+        """
         logger.info(f"[Slash] Responding to interaction: {content}")
         return self.response.send_message(content, **kwargs)
 
@@ -65,7 +72,6 @@ class CommandResponse:
         logger.info(f"[Slash] Response sent: {content}")
         
         # Return a dummy message
-        from utils.discord import Message, User
         return Message(
             id=0,
             content=content or "",
@@ -78,6 +84,23 @@ class CommandResponse:
         return self._responded
 
 # Slash command decorators
+def _cached_factory(factory):
+    """Reuse the decorator built by factory for repeated hashable arguments
+    
+    Calls whose arguments cannot be hashed (e.g. an options list) build a
+    fresh decorator as before.
+    """
+    cached = functools.lru_cache(maxsize=128)(factory)
+    
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return factory(*args, **kwargs)
+    return wrapper
+
+@_cached_factory
 def command(*, name=None, description="No description provided", **kwargs):
     """Decorator to create a slash command"""
     def decorator(func):
@@ -88,26 +111,30 @@ def command(*, name=None, description="No description provided", **kwargs):
         return func
     return decorator
 
+@_cached_factory
 def describe(**kwargs):
     """Decorator to describe slash command parameters"""
     def decorator(func):
-        func.__slash_command_parameter_descriptions__ = kwargs
+        # Copied per command, since a cached decorator is shared between them
+        func.__slash_command_parameter_descriptions__ = dict(kwargs)
         return func
     return decorator
 
+@_cached_factory
 def choices(**kwargs):
     """Decorator to add choices to slash command parameters"""
     def decorator(func):
-        func.__slash_command_parameter_choices__ = kwargs
+        func.__slash_command_parameter_choices__ = dict(kwargs)
         return func
     return decorator
 
+def _guild_only(func):
+    func.__slash_command_guild_only__ = True
+    return func
+
 def guild_only():
     """Decorator to restrict a slash command to guild channels only"""
-    def decorator(func):
-        func.__slash_command_guild_only__ = True
-        return func
-    return decorator
+    return _guild_only
 
 def check(predicate):
     """Decorator that adds a check to a slash command"""
@@ -183,14 +210,19 @@ def setup_app_commands(bot):
     
     # Collect commands from the bot
     for cmd_name, cmd in bot.commands.items():
-        if hasattr(cmd, '__slash_command__') and cmd.__slash_command__:
+        if getattr(cmd, '__slash_command__', False):
             slash_commands[cmd_name] = cmd
     
     # Collect commands from cogs
     for cog_name, cog in bot.cogs.items():
+        registered = getattr(type(cog), '__cog_slash_commands__', None)
+        if registered is not None:
+            for slash_name, attr_name in registered:
+                slash_commands[slash_name] = getattr(cog, attr_name)
+            continue
         for attr_name in dir(cog):
             attr = getattr(cog, attr_name)
-            if hasattr(attr, '__slash_command__') and attr.__slash_command__:
+            if getattr(attr, '__slash_command__', False):
                 slash_commands[attr.__slash_command_name__] = attr
     
     logger.info(f"Registered {len(slash_commands)} slash commands")
@@ -0,0 +1,134 @@
+"""
+Event Classifier Utilities
+
+This module provides precompiled matchers used by the events monitor to
+classify server log messages (events, player connections, voice calls)
+with a single case-insensitive regex scan per message.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Game event types, already lowercase
+EVENT_TYPES: Tuple[str, ...] = (
+    'mission', 'airdrop', 'crash', 'heli crash', 'trader', 'convoy', 'encounter', 'server restart'
+)
+
+# Game events; alternatives are tried at each position in this order
+_EVENT_RE = re.compile("|".join(map(re.escape, EVENT_TYPES)), re.IGNORECASE)
+
+# "disconnected" contains "connected", so one literal covers both
+_CONN_RE = re.compile(r"connected", re.IGNORECASE)
+
+_VOICE_RE = re.compile(r"voice call", re.IGNORECASE)
+
+
+def match_event_type(message: str) -> Optional[str]:
+    """
+    Get the event type mentioned in a log message
+
+    Args:
+        message: Log message
+
+    Returns:
+        Optional[str]: Lowercase event type, or None when no event matches
+    """
+    match = _EVENT_RE.search(message)
+    if match is None:
+        return None
+    return match.group(0).lower()
+
+
+def is_connection_message(message: str) -> bool:
+    """
+    Check whether a log message is a player connect/disconnect message
+
+    Args:
+        message: Log message
+
+    Returns:
+        bool: True for connection messages
+    """
+    return _CONN_RE.search(message) is not None
+
+
+def is_voice_call_message(message: str) -> bool:
+    """
+    Check whether a log message is a voice call message
+
+    Args:
+        message: Log message
+
+    Returns:
+        bool: True for voice call messages
+    """
+    return _VOICE_RE.search(message) is not None
+
+
+# Leading "[timestamp]" of a server log line
+_LOG_LINE_RE = re.compile(r"^\[([^\]]+)\]\s*(.*)$")
+
+
+def split_log_entries(text: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Split raw log text into entries with message and timestamp
+
+    Args:
+        text: Log text containing complete lines
+
+    Returns:
+        List[Dict[str, Optional[str]]]: Entries with 'message' and 'timestamp' keys
+    """
+    entries = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        match = _LOG_LINE_RE.match(line)
+        if match is None:
+            entries.append({'message': line, 'timestamp': None})
+        else:
+            entries.append({'message': match.group(2), 'timestamp': match.group(1)})
+    return entries
+
+
+def classify_entries(entries: List[Dict[str, Any]], voice_enabled: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Classify log entries into the notifications they should produce
+
+    This is pure CPU work with no awaits, so it can run in a worker thread
+    via asyncio.to_thread while the event loop keeps serving the gateway.
+
+    Args:
+        entries: Log entries with 'message' and 'timestamp' keys
+        voice_enabled: Whether voice call messages should be reported
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: (kind, payload) pairs in log order,
+        where kind is 'event', 'connection' or 'voice'
+    """
+    classified = []
+    for entry in entries:
+        message = entry.get('message', '')
+        timestamp = entry.get('timestamp')
+
+        event_type = match_event_type(message)
+        if event_type is not None:
+            classified.append(('event', {
+                'type': event_type,
+                'message': message,
+                'timestamp': timestamp
+            }))
+
+        if is_connection_message(message):
+            classified.append(('connection', {
+                'message': message,
+                'timestamp': timestamp
+            }))
+
+        if voice_enabled and is_voice_call_message(message):
+            classified.append(('voice', {
+                'message': message,
+                'timestamp': timestamp
+            }))
+
+    return classified
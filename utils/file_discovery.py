@@ -2,6 +2,7 @@
 File discovery utilities for handling CSV files and directory structures
 with robust error handling and path normalization.
 """
+import functools
 import os
 import logging
 import re
@@ -40,9 +41,12 @@ class FileDiscovery:
         
         # Initialize caches
         self._file_cache: List[str] = []
+        self._file_set: Set[str] = set()
+        self._basename_index: Dict[str, str] = {}
         self._cache_timestamp: float = 0
         self._known_directories: Set[str] = set()
         self._last_refresh_time: float = 0
+        self._directory_mtime_ns: Optional[int] = None
         
         # File categorization
         self.categories: Dict[str, List[str]] = {
@@ -82,6 +86,22 @@ class FileDiscovery:
             self.stats["cache_hits"] += 1
             return False
             
+        # A directory's mtime changes whenever entries are added, removed or
+        # renamed in it. Recursive scans can't rely on this: changes inside
+        # subdirectories don't touch the base directory's mtime.
+        directory_mtime_ns = None
+        if not self.recursive:
+            try:
+                directory_mtime_ns = os.stat(self.base_directory).st_mtime_ns
+            except OSError:
+                pass
+            if (not force and self._file_cache and
+                    directory_mtime_ns is not None and
+                    directory_mtime_ns == self._directory_mtime_ns):
+                self._cache_timestamp = now
+                self.stats["cache_hits"] += 1
+                return False
+            
         self.stats["cache_misses"] += 1
         start_time = time.time()
         
@@ -92,12 +112,13 @@ class FileDiscovery:
                 recursive=self.recursive,
                 max_files=5000
             )
+            # Discovery returns paths in ascending order; keep the cache
+            # (and so each category list) newest first
+            self._file_cache.reverse()
             
             # Update categories
-            self.categories = {"map": [], "standard": [], "unknown": []}
-            for file in self._file_cache:
-                category = get_csv_file_category(file)
-                self.categories[category].append(file)
+            self.categories, directories, self._basename_index = _categorize_files(self._file_cache)
+            self._file_set = set(self._file_cache)
                 
             # Update stats and cache timestamp
             self.stats["total_files"] = len(self._file_cache)
@@ -106,7 +127,8 @@ class FileDiscovery:
             self.stats["last_refresh_duration"] = time.time() - start_time
             
             # Track directories
-            self._known_directories = {os.path.dirname(f) for f in self._file_cache}
+            self._known_directories = directories
+            self._directory_mtime_ns = directory_mtime_ns
             
             return True
         except Exception as e:
@@ -139,14 +161,14 @@ class FileDiscovery:
             
         # Filter and return files
         if category and category in self.categories:
-            files = self.categories[category][:max_files]
+            files = self.categories[category]
         else:
-            files = self._file_cache[:max_files]
+            files = self._file_cache
             
-        # Sort (usually by timestamp in filename)
+        # The caches are sorted newest first (names usually carry a timestamp)
         if sort_reverse:
-            return sorted(files, reverse=True)
-        return sorted(files)
+            return files[:max_files]
+        return files[max(len(files) - max_files, 0):][::-1]
         
     def get_latest_file(self, category: Optional[str] = None) -> Optional[str]:
         """
@@ -176,14 +198,12 @@ class FileDiscovery:
             self.refresh_cache()
             
         # Check if the exact path is in the cache
-        if filename in self._file_cache:
+        if filename in self._file_set:
             return True
             
         # Check if it's just the basename we're looking for
-        basename = os.path.basename(filename)
-        for cached_file in self._file_cache:
-            if os.path.basename(cached_file) == basename:
-                return True
+        if os.path.basename(filename) in self._basename_index:
+            return True
                 
         # Direct filesystem check as fallback
         return os.path.exists(filename) and os.path.isfile(filename)
@@ -193,6 +213,26 @@ CSV_TIMESTAMP_PATTERN = re.compile(r'(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\.
 CSV_FILENAME_PATTERN = re.compile(r'^(.*?)(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\.csv$')
 MAP_FILENAME_PATTERN = re.compile(r'^map_(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\.csv$')
 
+# Bare "yyyy.mm.dd-hh.mm.ss" timestamp, matched against a known slice of a
+# basename once cheaper prefix/suffix checks have passed
+_TS_RE = re.compile(r'\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}')
+_TS_LEN = 19
+_MAP_BASENAME_LEN = len('map_') + _TS_LEN + len('.csv')
+
+def _is_map_basename(basename: str) -> bool:
+    """Fast equivalent of MAP_FILENAME_PATTERN.match for a basename"""
+    return (len(basename) == _MAP_BASENAME_LEN and
+            basename.startswith('map_') and
+            basename.endswith('.csv') and
+            _TS_RE.fullmatch(basename, 4, 4 + _TS_LEN) is not None)
+
+def _is_standard_basename(basename: str) -> bool:
+    """Fast equivalent of CSV_FILENAME_PATTERN.match for a basename"""
+    end = len(basename) - 4
+    return (end >= _TS_LEN and
+            basename.endswith('.csv') and
+            _TS_RE.fullmatch(basename, end - _TS_LEN, end) is not None)
+
 class FileDiscoveryError(Exception):
     """Base exception for file discovery errors"""
     pass
@@ -205,6 +245,11 @@ class NoFilesFoundError(FileDiscoveryError):
     """Exception raised when no files match the criteria"""
     pass
 
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a caller-supplied include/exclude pattern once"""
+    return re.compile(pattern)
+
 def normalize_path(path: str) -> str:
     """Normalize a path for consistent handling
 
@@ -257,7 +302,8 @@ def discover_csv_files(
     recursive: bool = False,
     include_pattern: Optional[str] = None,
     exclude_pattern: Optional[str] = None,
-    max_files: int = 1000
+    max_files: int = 1000,
+    include_regex: Optional[re.Pattern] = None
 ) -> List[str]:
     """Discover CSV files in a directory with robust error handling
 
@@ -267,6 +313,7 @@ def discover_csv_files(
         include_pattern: Regex pattern for files to include
         exclude_pattern: Regex pattern for files to exclude
         max_files: Maximum number of files to return
+        include_regex: Precompiled include pattern, used instead of include_pattern
 
     Returns:
         List of file paths
@@ -283,8 +330,9 @@ def discover_csv_files(
         raise DirectoryNotFoundError(f"Directory not found: {base_dir}")
 
     # Compile regex patterns if provided
-    include_regex = re.compile(include_pattern) if include_pattern else None
-    exclude_regex = re.compile(exclude_pattern) if exclude_pattern else None
+    if include_regex is None and include_pattern:
+        include_regex = _compile_pattern(include_pattern)
+    exclude_regex = _compile_pattern(exclude_pattern) if exclude_pattern else None
 
     # Find all files
     found_files = []
@@ -295,17 +343,23 @@ def discover_csv_files(
 
     try:
         if recursive:
-            # Recursive search with os.walk
-            for root, _, files in os.walk(base_dir):
-                _process_directory_files(root, files, found_files, include_regex, exclude_regex, max_files)
+            # Depth-first traversal with os.scandir; like os.walk, symlinked
+            # directories are not followed and unreadable ones are skipped
+            pending = [base_dir]
+            while pending:
+                directory = pending.pop()
+                try:
+                    _scan_directory(directory, found_files, include_regex, exclude_regex, max_files, pending)
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable directory {directory}: {e}")
+                    continue
                 if len(found_files) >= max_files:
                     logger.warning(f"Max file limit ({max_files}) reached during discovery")
                     break
         else:
             # Non-recursive - just look in the base directory
             if os.path.exists(base_dir) and os.path.isdir(base_dir):
-                files = [f for f in os.listdir(base_dir) if os.path.isfile(os.path.join(base_dir, f))]
-                _process_directory_files(base_dir, files, found_files, include_regex, exclude_regex, max_files)
+                _scan_directory(base_dir, found_files, include_regex, exclude_regex, max_files)
     except Exception as e:
         logger.error(f"Error during file discovery: {e}f")
         raise FileDiscoveryError(f"Error during file discovery: {e}f")
@@ -321,42 +375,51 @@ def discover_csv_files(
 
     return found_files
 
-def _process_directory_files(
+def _scan_directory(
     directory: str,
-    files: List[str],
     found_files: List[str],
     include_regex: Optional[re.Pattern],
     exclude_regex: Optional[re.Pattern],
-    max_files: int
+    max_files: int,
+    subdirectories: Optional[List[str]] = None
 ) -> None:
-    """Process files in a directory and add matching ones to found_files
+    """Scan a directory and add matching CSV files to found_files
 
     Args:
-        directory: Directory containing the files
-        files: List of filenames
+        directory: Directory to scan
         found_files: List to add matching files to
         include_regex: Regex pattern for files to include
         exclude_regex: Regex pattern for files to exclude
         max_files: Maximum number of files to find
+        subdirectories: If given, subdirectory paths are appended to it
     """
-    for filename in files:
-        # Skip if we've reached the maximum
-        if len(found_files) >= max_files:
-            return
-
-        # Only process .csv files
-        if not filename.lower().endswith('.csv'):
-            continue
-
-        # Check against include/exclude patterns
-        if include_regex and not include_regex.search(filename):
-            continue
-        if exclude_regex and exclude_regex.search(filename):
-            continue
-
-        # Add the full path to the results
-        full_path = os.path.join(directory, filename)
-        found_files.append(full_path)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Skip if we've reached the maximum
+            if len(found_files) >= max_files:
+                return
+
+            if subdirectories is not None and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+                continue
+
+            # Only process .csv files, in any letter case; only the last four
+            # characters are lowercased, not the whole name
+            filename = entry.name
+            if filename[-4:].lower() != '.csv':
+                continue
+
+            # Check against include/exclude patterns
+            if include_regex and not include_regex.search(filename):
+                continue
+            if exclude_regex and exclude_regex.search(filename):
+                continue
+
+            # DirEntry caches the file type from the directory listing
+            if not entry.is_file():
+                continue
+
+            found_files.append(entry.path)
 
 def discover_map_csv_files(base_directory: str, max_files: int = 1000) -> List[str]:
     """Discover map-specific CSV files
@@ -382,7 +445,7 @@ def discover_map_csv_files(base_directory: str, max_files: int = 1000) -> List[s
             return discover_csv_files(
                 maps_dir,
                 recursive=False,
-                include_pattern=r'^map_\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}\.csv$',
+                include_regex=MAP_FILENAME_PATTERN,
                 max_files=max_files
             )
         except NoFilesFoundError:
@@ -395,7 +458,7 @@ def discover_map_csv_files(base_directory: str, max_files: int = 1000) -> List[s
         return discover_csv_files(
             base_directory,
             recursive=False,
-            include_pattern=r'^map_\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}\.csv$',
+            include_regex=MAP_FILENAME_PATTERN,
             max_files=max_files
         )
     except NoFilesFoundError:
@@ -460,8 +523,38 @@ def is_map_csv_file(filename: str) -> bool:
     Returns:
         True if it's a map CSV file, False otherwise
     """
-    basename = os.path.basename(filename)
-    return bool(MAP_FILENAME_PATTERN.match(basename))
+    return _is_map_basename(os.path.basename(filename))
+
+def _categorize_files(files: List[str]) -> Tuple[Dict[str, List[str]], Set[str], Dict[str, str]]:
+    """Group files by category, as get_csv_file_category would
+
+    The "inside a maps directory" check is made once per directory rather
+    than once per file.
+
+    Args:
+        files: File paths to categorize
+
+    Returns:
+        Category -> file paths, the set of directories seen, and
+        basename -> path (the last path wins for duplicate basenames)
+    """
+    categories: Dict[str, List[str]] = {"map": [], "standard": [], "unknown": []}
+    in_maps_dir: Dict[str, bool] = {}
+    basenames: Dict[str, str] = {}
+    for path in files:
+        directory, basename = os.path.split(path)
+        basenames[basename] = path
+        in_maps = in_maps_dir.get(directory)
+        if in_maps is None:
+            in_maps = in_maps_dir[directory] = "maps" in os.path.normpath(directory).split(os.path.sep)
+
+        if in_maps or _is_map_basename(basename):
+            categories["map"].append(path)
+        elif _is_standard_basename(basename):
+            categories["standard"].append(path)
+        else:
+            categories["unknown"].append(path)
+    return categories, set(in_maps_dir), basenames
 
 def get_csv_file_category(filename: str) -> str:
     """Determine the category of a CSV file based on its name and location
@@ -479,11 +572,11 @@ def get_csv_file_category(filename: str) -> str:
         return "map"
 
     # Check filename pattern for map files
-    if MAP_FILENAME_PATTERN.match(basename):
+    if _is_map_basename(basename):
         return "map"
 
     # Check for standard CSV pattern
-    if CSV_FILENAME_PATTERN.match(basename):
+    if _is_standard_basename(basename):
         return "standard"
 
     return "unknown"
\ No newline at end of file
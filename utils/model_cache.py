@@ -0,0 +1,180 @@
+"""
+Model Cache Utilities
+
+This module provides a small in-memory TTL cache for model lookups
+(such as Server.get_by_id and Guild.get_by_id) so that monitors which
+start or restart for the same server do not repeat database queries.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# key -> (expires_at, value)
+_cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+
+async def get_cached(key: Hashable, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Get a value from the cache, loading it if missing or expired
+
+    None results are not cached so missing documents are retried.
+
+    Args:
+        key: Cache key, e.g. ("server", guild_id, server_id)
+        ttl: Time-to-live in seconds
+        loader: Zero-argument callable returning an awaitable that loads the value
+
+    Returns:
+        The cached or freshly loaded value
+    """
+    now = time.time()
+    entry = _cache.get(key)
+    if entry is not None:
+        expires_at, value = entry
+        if now < expires_at:
+            return value
+        del _cache[key]
+
+    value = await loader()
+    if value is not None:
+        _cache[key] = (now + ttl, value)
+    return value
+
+
+def invalidate(*key_prefix: Any) -> None:
+    """
+    Invalidate cached entries
+
+    Args:
+        *key_prefix: Leading key elements to match, e.g. ("server", guild_id).
+            With no arguments the whole cache is cleared.
+    """
+    if not key_prefix:
+        _cache.clear()
+        return
+
+    size = len(key_prefix)
+    for key in [k for k in _cache if isinstance(k, tuple) and k[:size] == key_prefix]:
+        del _cache[key]
+
+
+def invalidate_server(guild_id: Any, server_id: Optional[Any] = None) -> None:
+    """
+    Invalidate cached Server lookups for a guild
+
+    Args:
+        guild_id: Guild ID
+        server_id: Optional server ID; all servers of the guild when omitted
+    """
+    if server_id is None:
+        invalidate("server", str(guild_id))
+    else:
+        invalidate("server", str(guild_id), str(server_id))
+
+
+def invalidate_guild(guild_id: Any) -> None:
+    """
+    Invalidate the cached Guild lookup for a guild
+
+    Args:
+        guild_id: Guild ID
+    """
+    invalidate("guild", str(guild_id))
+
+
+async def load_monitor_context(db, guild_id: Any, server_id: Any, monitor_type: str,
+                               ttl: float = 60) -> Optional[Tuple[Any, Any, Dict[str, Any]]]:
+    """
+    Resolve the guild, server and monitoring documents for a monitor in one query
+
+    Runs a single aggregation on the guilds collection that joins the
+    matching game_servers and monitoring documents. The resulting Server
+    and Guild models are stored in the cache, and when both are already
+    cached only the monitoring document is fetched. When the server is not
+    in game_servers, Server.get_by_id is used for its fallback lookups.
+
+    Args:
+        db: Database connection
+        guild_id: Guild ID
+        server_id: Server ID
+        monitor_type: Monitor type, e.g. "events"
+        ttl: Time-to-live for the cached models in seconds
+
+    Returns:
+        Optional[Tuple[Server, Optional[Guild], Dict[str, Any]]]: Server, guild
+        and monitoring document, or None if the guild has no servers or the
+        server does not exist
+    """
+    # Imported here to avoid circular imports
+    from models.guild import Guild
+    from models.server import Server
+    from utils.server_utils import standardize_server_id
+
+    guild_key = str(guild_id)
+    server_key = ("server", guild_key, str(server_id))
+    guild_cache_key = ("guild", guild_key)
+
+    # With both models cached only the monitoring document is needed
+    now = time.time()
+    server_entry = _cache.get(server_key)
+    guild_entry = _cache.get(guild_cache_key)
+    if server_entry is not None and guild_entry is not None \
+            and now < server_entry[0] and now < guild_entry[0]:
+        monitoring_doc = await db.monitoring.find_one(
+            {"guild_id": guild_id, "server_id": server_id, "type": monitor_type}
+        )
+        return server_entry[1], guild_entry[1], monitoring_doc or {}
+
+    standardized_server_id = standardize_server_id(server_id)
+
+    pipeline = [
+        {"$match": {
+            "guild_id": {"$in": [guild_id, guild_key]},
+            "servers": {"$exists": True, "$ne": []}
+        }},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "game_servers",
+            "let": {},
+            "pipeline": [
+                {"$match": {"server_id": standardized_server_id, "guild_id": guild_key}},
+                {"$limit": 1}
+            ],
+            "as": "server_docs"
+        }},
+        {"$lookup": {
+            "from": "monitoring",
+            "let": {},
+            "pipeline": [
+                {"$match": {"guild_id": guild_id, "server_id": server_id, "type": monitor_type}},
+                {"$limit": 1}
+            ],
+            "as": "monitoring_docs"
+        }}
+    ]
+
+    results = await db.guilds.aggregate(pipeline).to_list(1)
+    if not results:
+        return None
+
+    guild_doc = results[0]
+    server_docs = guild_doc.pop("server_docs", [])
+    monitoring_docs = guild_doc.pop("monitoring_docs", [])
+
+    if server_docs:
+        server = Server.from_document(server_docs[0])
+    else:
+        server = await Server.get_by_id(db, server_id, guild_key)
+    if server is None:
+        return None
+
+    guild_model = Guild.create_from_db_document(guild_doc, db)
+
+    _cache[server_key] = (now + ttl, server)
+    if guild_model is not None:
+        _cache[guild_cache_key] = (now + ttl, guild_model)
+
+    return server, guild_model, (monitoring_docs[0] if monitoring_docs else {})
@@ -0,0 +1,152 @@
+"""
+Monitoring Status Utilities
+
+This module buffers routine monitoring-status writes (heartbeats such as
+``last_updated``) in memory and flushes them to the ``monitoring``
+collection with a single bulk_write on a fixed interval. A failed flush
+puts its updates back in the buffer, and shutdown() writes what is left
+when the bot closes. Exceptional state changes (running, error) should
+still be written directly.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# Seconds between buffered flushes
+FLUSH_INTERVAL = 30
+
+
+def utcnow() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+def queue_status(bot, guild_id: Any, server_id: Any, monitor_type: str, fields: Dict[str, Any]) -> None:
+    """
+    Buffer a monitoring-status update to be written by the flush task
+
+    last_updated is stamped at flush time unless given in fields.
+
+    Args:
+        bot: Bot instance holding the buffer
+        guild_id: Guild ID
+        server_id: Server ID
+        monitor_type: Monitor type, e.g. "events"
+        fields: Fields to $set on the monitoring document
+    """
+    dirty = getattr(bot, "_monitoring_dirty", None)
+    if dirty is None:
+        dirty = bot._monitoring_dirty = {}
+
+    key = (guild_id, server_id, monitor_type)
+    pending = dirty.get(key)
+    if pending is None:
+        dirty[key] = dict(fields)
+    else:
+        pending.update(fields)
+
+    ensure_flush_task(bot)
+
+
+async def flush_status(bot) -> int:
+    """
+    Write all buffered monitoring-status updates in one bulk_write
+
+    Args:
+        bot: Bot instance holding the buffer
+
+    Returns:
+        int: Number of updates written
+    """
+    dirty: Dict[Tuple[Any, Any, str], Dict[str, Any]] = getattr(bot, "_monitoring_dirty", None)
+    if not dirty:
+        return 0
+
+    bot._monitoring_dirty = {}
+
+    # One timestamp for the whole batch
+    now = utcnow()
+
+    ops = []
+    for (guild_id, server_id, monitor_type), fields in dirty.items():
+        ops.append(UpdateOne(
+            {"guild_id": guild_id, "server_id": server_id, "type": monitor_type},
+            {"$set": {"last_updated": now, **fields}},
+            upsert=True
+        ))
+
+    try:
+        await bot.db.monitoring.bulk_write(ops, ordered=False)
+    except BaseException:
+        _requeue(bot, dirty)
+        raise
+    return len(ops)
+
+
+def _requeue(bot, dirty: Dict[Tuple[Any, Any, str], Dict[str, Any]]) -> None:
+    """Put updates from a failed flush back, keeping fields queued since"""
+    pending = getattr(bot, "_monitoring_dirty", None)
+    if pending is None:
+        pending = bot._monitoring_dirty = {}
+
+    for key, fields in dirty.items():
+        newer = pending.get(key)
+        if newer is not None:
+            fields.update(newer)
+        pending[key] = fields
+
+
+async def shutdown(bot) -> None:
+    """
+    Stop the flush task and write whatever is still buffered
+
+    Args:
+        bot: Bot instance holding the buffer
+    """
+    task = getattr(bot, "_monitoring_flush_task", None)
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    bot._monitoring_flush_task = None
+
+    try:
+        await flush_status(bot)
+    except Exception as e:
+        logger.error(f"Error flushing monitoring status on shutdown: {e}")
+
+
+async def _flush_loop(bot, interval: float) -> None:
+    """Periodically flush buffered monitoring-status updates"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_status(bot)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Never block the monitors on heartbeat failures
+            logger.error(f"Error flushing monitoring status: {e}")
+
+
+def ensure_flush_task(bot, interval: float = FLUSH_INTERVAL) -> None:
+    """
+    Start the background flush task for a bot if it is not running
+
+    Args:
+        bot: Bot instance
+        interval: Seconds between flushes
+    """
+    task = getattr(bot, "_monitoring_flush_task", None)
+    if task is not None and not task.done():
+        return
+
+    bot._monitoring_flush_task = asyncio.create_task(_flush_loop(bot, interval))
@@ -257,6 +257,48 @@ def extract_numeric_id(server_id: str, server_name: Optional[str] = None,
     # Failed to extract numeric ID
     return None
 
+# Name-scan results of resolve_original_server_id, keyed by (server_id, server_name)
+_name_scan_ids: Dict[Tuple[str, str], str] = {}
+
+def resolve_original_server_id(server: Any, server_id: str) -> str:
+    """Resolve the original numeric server ID used for log path construction.
+    
+    The lookup order matches the monitors: the server's original_server_id
+    attribute, dict-style access, server_data, a numeric server_id, and
+    finally a 4+ digit word in server_name (via extract_numeric_id). Only the
+    name scan is memoized, in this process; the server object is never
+    modified and the guess is never written back to the database.
+    
+    Args:
+        server: Server model (or dict-like) for the server
+        server_id: Server ID the monitor was started with
+        
+    Returns:
+        Original server ID, or server_id if none was found
+    """
+    get = getattr(server, "get", None)
+    server_data = getattr(server, "server_data", None)
+    
+    if getattr(server, "original_server_id", None):
+        return server.original_server_id
+    if callable(get) and get("original_server_id"):
+        return get("original_server_id")
+    if isinstance(server_data, dict) and "original_server_id" in server_data:
+        return server_data["original_server_id"]
+    if str(server_id).isdigit():
+        return server_id
+    
+    server_name = str(getattr(server, "server_name", "") or "")
+    key = (str(server_id), server_name)
+    if key not in _name_scan_ids:
+        # Only the server name is passed so the scan doesn't fall through to UUID hashing
+        name_id = extract_numeric_id(None, server_name)
+        if name_id:
+            logger.info(f"Found potential numeric server ID in server_name: {name_id}")
+        _name_scan_ids[key] = name_id or server_id
+    
+    return _name_scan_ids[key]
+
 def get_path_components(server_id: str, hostname: str, 
                        original_server_id: Optional[str] = None,
                        guild_id: Optional[str] = None) -> Tuple[str, str]:
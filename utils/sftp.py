@@ -38,6 +38,16 @@ SFTP_ENABLED = os.environ.get("SFTP_ENABLED", "false").lower() == "true"
 if not SFTP_ENABLED:
     logger.warning("SFTP functionality is disabled. Set SFTP_ENABLED=true to enable it.")
 
+# Transfer tuning: 128 KB pipelined reads and a 1 MB SSH channel window
+# keep WAN links busy instead of waiting on one small SSH_FXP_READ at a time
+SFTP_READ_BLOCK_SIZE = 131072
+SFTP_MAX_REQUESTS = 16
+SSH_WINDOW_SIZE = 2 ** 20
+SSH_MAX_PKTSIZE = 32768
+
+# Bytes at the start of a log file used to detect rotation
+LOG_HEAD_SIG_SIZE = 16
+
 # Global connection pool for connection reuse
 CONNECTION_POOL: Dict[str, 'SFTPClient'] = {}
 POOL_LOCK = asyncio.Lock()
@@ -1901,6 +1911,30 @@ class SFTPClient:
             await self.disconnect()
             return False
 
+    async def ping(self, timeout: float = 5.0) -> bool:
+        """Check that the session still answers with one cheap SFTP round trip
+
+        Unlike check_connection this never disconnects, so callers can skip a
+        full reconnect when the session is still alive.
+
+        Args:
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            bool: True if the server replied
+        """
+        if not self._connected or not self._sftp_client:
+            return False
+
+        try:
+            async with asyncio.timeout(timeout):
+                await self._sftp_client.realpath(".")
+            self.last_activity = datetime.now()
+            return True
+        except Exception as e:
+            logger.debug(f"Ping to {self.connection_id} failed: {e}")
+            return False
+
     @retryable(max_retries=3, delay=1.0, backoff=2.0, 
                exceptions=(asyncio.TimeoutError, ConnectionError, OSError))
     async def connect(self) -> 'SFTPClient':
@@ -1985,7 +2019,9 @@ class SFTPClient:
                     connect_timeout=self.timeout,
                     login_timeout=self.timeout,
                     keepalive_interval=30,   # Send keepalive every 30 seconds
-                    keepalive_count_max=3    # Disconnect after 3 failed keepalives
+                    keepalive_count_max=3,   # Disconnect after 3 failed keepalives
+                    window=SSH_WINDOW_SIZE,
+                    max_pktsize=SSH_MAX_PKTSIZE
                 )
                 
                 # Only assign to instance var after successful connection
@@ -2265,7 +2301,11 @@ class SFTPClient:
                     try:
                         # Try the direct AsyncSSH method for reading files
                         # In AsyncSSH 2.x, the method is called 'open', not 'readfile'
-                        async with await self._sftp_client.open(remote_path, 'rb') as f:
+                        async with await self._sftp_client.open(
+                            remote_path, 'rb',
+                            block_size=SFTP_READ_BLOCK_SIZE,
+                            max_requests=SFTP_MAX_REQUESTS
+                        ) as f:
                             content = await f.read()
                         self.last_activity = datetime.now()
                         if isinstance(content, str):
@@ -2463,7 +2503,7 @@ class SFTPClient:
             logger.error(f"Failed to download file {remote_path}: {e}")
             return None
 
-    async def read_file_by_chunks(self, remote_path: str, chunk_size: int = 4096) -> Optional[List[bytes]]:
+    async def read_file_by_chunks(self, remote_path: str, chunk_size: int = SFTP_READ_BLOCK_SIZE) -> Optional[List[bytes]]:
         """Read file by chunks
 
         Args:
@@ -2481,7 +2521,8 @@ class SFTPClient:
                 return None
 
             chunks = []
-            async with self._sftp_client.open(remote_path, 'rb') as f:
+            async with self._sftp_client.open(remote_path, 'rb', block_size=chunk_size,
+                                              max_requests=SFTP_MAX_REQUESTS) as f:
                 while True:
                     chunk = await f.read(chunk_size)
                     if not chunk:
@@ -2495,6 +2536,60 @@ class SFTPClient:
             logger.error(f"Failed to read file {remote_path} by chunks: {e}")
             return None
 
+    async def read_since(self, remote_path: str, offset: int = 0,
+                         head_sig: Optional[bytes] = None) -> Optional[Tuple[bytes, int, Optional[bytes]]]:
+        """Read the complete lines appended to a file since an offset
+
+        Only the bytes after offset are transferred. The file is read from
+        the start again when it was rotated: it is smaller than offset, or
+        its first bytes no longer match head_sig. The head is read in the
+        same open as the new data, so detection costs no extra stat.
+        A trailing partial line is left for the next call.
+
+        Args:
+            remote_path: Remote file path
+            offset: Byte offset returned by the previous call
+            head_sig: Head signature returned by the previous call
+
+        Returns:
+            Tuple of (new bytes, new offset, new head signature) or None if failed
+        """
+        await self.ensure_connected()
+
+        try:
+            if not self._sftp_client:
+                logger.error(f"SFTP client is missing when trying to read {remote_path} since offset {offset}")
+                return None
+
+            attrs = await self._sftp_client.stat(remote_path)
+            size = attrs.size or 0
+            if size < offset:
+                logger.info(f"{remote_path} shrank below offset {offset}, reading from start")
+                offset = 0
+            if size == offset:
+                return b"", offset, head_sig
+
+            async with self._sftp_client.open(remote_path, 'rb', block_size=SFTP_READ_BLOCK_SIZE,
+                                              max_requests=SFTP_MAX_REQUESTS) as f:
+                if offset:
+                    head = await f.read(LOG_HEAD_SIG_SIZE, 0)
+                    if head_sig and head[:len(head_sig)] != head_sig:
+                        logger.info(f"{remote_path} was rotated, reading from start")
+                        offset = 0
+                chunk = await f.read(size - offset, offset)
+            self.last_activity = datetime.now()
+
+            if not offset:
+                head = chunk[:LOG_HEAD_SIG_SIZE]
+
+            # Keep a trailing partial line for the next read
+            end = chunk.rfind(b"\n") + 1
+            return chunk[:end], offset + end, head
+
+        except Exception as e:
+            logger.error(f"Failed to read {remote_path} since offset {offset}: {e}")
+            return None
+
     async def read_file(self, remote_path: str, start_line: int = 0, max_lines: int = -1) -> Optional[List[str]]:
         """Read file from remote server with line control
 
@@ -0,0 +1,317 @@
+"""
+SFTP Client Pool for server monitors
+
+This module provides a small per-server pool of connected SFTP clients
+shared by all monitors (events, killfeed, ...) of the same game server:
+1. Up to max_size clients per (guild_id, server_id) so reads run in parallel
+2. core_size clients are kept warm, extra idle clients are reaped
+3. Clients are returned through an async context manager so the pool
+   cannot leak capacity when a monitor raises
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+
+# Configure module-specific logger
+logger = logging.getLogger(__name__)
+
+# Default configuration values
+DEFAULT_CORE_SIZE = 1
+DEFAULT_MAX_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 30  # seconds
+
+# Errors that mean a client should be discarded instead of reused
+CONNECTION_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError, EOFError, OSError)
+
+# asyncssh connection errors, matched by name so asyncssh stays optional here
+CONNECTION_ERROR_NAMES = frozenset({"ConnectionLost", "DisconnectError", "ChannelOpenError"})
+
+ClientFactory = Callable[[], Awaitable[Any]]
+
+
+def is_connection_error(exc: Optional[BaseException]) -> bool:
+    """Check whether an exception means the SFTP connection is broken
+
+    Args:
+        exc: Exception raised while using a client
+
+    Returns:
+        bool: True if the client should be discarded
+    """
+    if exc is None:
+        return False
+    return isinstance(exc, CONNECTION_ERRORS) or type(exc).__name__ in CONNECTION_ERROR_NAMES
+
+
+def is_client_connected(client: Any) -> bool:
+    """Read a client's is_connected state without a network round trip
+
+    SFTPClient and SFTPManager expose is_connected as a property; other
+    clients may still implement it as a method, so both are accepted.
+
+    Args:
+        client: Pooled client
+
+    Returns:
+        bool: True if the client reports an open connection
+    """
+    flag = getattr(client, "is_connected", False)
+    return bool(flag() if callable(flag) else flag)
+
+
+class _ServerSlot:
+    """Pool state for a single (guild_id, server_id) key"""
+
+    def __init__(self):
+        # (released_at, client), most recently released on the right
+        self.idle: Deque[Tuple[float, Any]] = deque()
+        self.size = 0
+        self.condition = asyncio.Condition()
+
+
+class SFTPClientPool:
+    """Per-server pool of connected SFTP clients
+
+    Clients are created by a factory supplied on acquire, so the pool
+    works with any client exposing connect/disconnect and an is_connected
+    property (or method). Acquire only reads that local flag; clients with
+    a ping method are probed in the background when released instead.
+    """
+
+    def __init__(
+        self,
+        core_size: int = DEFAULT_CORE_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """Initialize the pool
+
+        Args:
+            core_size: Idle clients kept per server regardless of idle time
+            max_size: Maximum clients per server
+            idle_timeout: Seconds an extra idle client is kept before closing
+        """
+        self.core_size = core_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._slots: Dict[Hashable, _ServerSlot] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._validation_tasks: Set[asyncio.Task] = set()
+
+    def _slot(self, key: Hashable) -> _ServerSlot:
+        """Get or create the slot for a key"""
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _ServerSlot()
+        return slot
+
+    def acquire(self, guild_id: Any, server_id: Any, factory: ClientFactory) -> "PooledClient":
+        """Acquire a client for a server
+
+        Use with 'async with':
+
+        async with pool.acquire(guild_id, server_id, factory) as sftp_client:
+            log_file = await sftp_client.get_log_file()
+
+        Args:
+            guild_id: Guild ID
+            server_id: Server ID
+            factory: Coroutine function creating a new connected client
+
+        Returns:
+            PooledClient context manager
+        """
+        return PooledClient(self, (str(guild_id), str(server_id)), factory)
+
+    async def _checkout(self, key: Hashable, factory: ClientFactory) -> Any:
+        """Take an idle client or create a new one, waiting when at max_size"""
+        self._ensure_reaper()
+        slot = self._slot(key)
+
+        async with slot.condition:
+            while True:
+                while slot.idle:
+                    _, client = slot.idle.pop()
+                    # Local state check only, no network round trip
+                    if is_client_connected(client):
+                        return client
+                    slot.size -= 1
+                    await self._close_client(client)
+
+                if slot.size < self.max_size:
+                    slot.size += 1
+                    break
+
+                await slot.condition.wait()
+
+        try:
+            return await factory()
+        except BaseException:
+            async with slot.condition:
+                slot.size -= 1
+                slot.condition.notify()
+            raise
+
+    async def release(self, key: Hashable, client: Any, discard: bool = False) -> None:
+        """Return a client to the pool
+
+        Args:
+            key: Pool key returned by acquire
+            client: Client to return
+            discard: Close the client instead of keeping it
+        """
+        slot = self._slot(key)
+        async with slot.condition:
+            if discard:
+                slot.size -= 1
+            else:
+                slot.idle.append((time.monotonic(), client))
+            slot.condition.notify()
+
+        ping = None if discard else getattr(client, "ping", None)
+        if discard:
+            await self._close_client(client)
+        elif ping is not None:
+            # Validate in the background so acquire never waits on a probe
+            task = asyncio.create_task(self._validate_idle(key, client, ping))
+            self._validation_tasks.add(task)
+            task.add_done_callback(self._validation_tasks.discard)
+
+    async def _validate_idle(self, key: Hashable, client: Any, ping: Callable[[], Awaitable[bool]]) -> None:
+        """Ping a released client and drop it from the idle list if dead"""
+        try:
+            alive = await ping()
+        except Exception:
+            alive = False
+        if alive:
+            return
+
+        slot = self._slot(key)
+        async with slot.condition:
+            for entry in slot.idle:
+                if entry[1] is client:
+                    slot.idle.remove(entry)
+                    slot.size -= 1
+                    break
+            else:
+                # Already checked out again; the user will see the failure
+                return
+            slot.condition.notify()
+
+        logger.info(f"Dropping dead pooled SFTP client for {key}")
+        await self._close_client(client)
+
+    async def _close_client(self, client: Any) -> None:
+        """Disconnect a client, ignoring errors"""
+        try:
+            await client.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing pooled SFTP client: {e}")
+
+    def _ensure_reaper(self) -> None:
+        """Start the idle reaper task if needed"""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reaper_loop())
+
+    async def _reaper_loop(self) -> None:
+        """Close idle clients above core_size that exceeded idle_timeout"""
+        while True:
+            await asyncio.sleep(self.idle_timeout)
+            try:
+                await self.reap_idle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error reaping idle SFTP clients: {e}")
+
+    async def reap_idle(self) -> int:
+        """Close idle clients above core_size that exceeded idle_timeout
+
+        Returns:
+            int: Number of clients closed
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = []
+
+        for slot in list(self._slots.values()):
+            async with slot.condition:
+                # Oldest idle clients are on the left
+                while len(slot.idle) > self.core_size and slot.idle[0][0] < cutoff:
+                    _, client = slot.idle.popleft()
+                    slot.size -= 1
+                    expired.append(client)
+                slot.condition.notify_all()
+
+        for client in expired:
+            await self._close_client(client)
+
+        return len(expired)
+
+    async def close(self) -> None:
+        """Close all idle clients and stop the reaper"""
+        if self._reaper_task and not self._reaper_task.done():
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+        self._reaper_task = None
+
+        for slot in list(self._slots.values()):
+            async with slot.condition:
+                clients = [client for _, client in slot.idle]
+                slot.size -= len(clients)
+                slot.idle.clear()
+            for client in clients:
+                await self._close_client(client)
+
+
+class PooledClient:
+    """Context manager returned by SFTPClientPool.acquire
+
+    The client is returned to the pool on exit, or closed when the block
+    raised a connection error.
+    """
+
+    def __init__(self, pool: SFTPClientPool, key: Hashable, factory: ClientFactory):
+        """Initialize the context manager
+
+        Args:
+            pool: Owning pool
+            key: Pool key
+            factory: Coroutine function creating a new connected client
+        """
+        self.pool = pool
+        self.key = key
+        self.factory = factory
+        self.client = None
+
+    async def __aenter__(self) -> Any:
+        """Acquire a client from the pool"""
+        self.client = await self.pool._checkout(self.key, self.factory)
+        return self.client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the client back to the pool"""
+        if self.client is not None:
+            discard = is_connection_error(exc_val)
+            await self.pool.release(self.key, self.client, discard=discard)
+            self.client = None
+
+
+def get_sftp_pool(bot) -> SFTPClientPool:
+    """Get the shared client pool for a bot, creating it on first use
+
+    Args:
+        bot: Bot instance
+
+    Returns:
+        SFTPClientPool instance stored as bot.sftp_pool
+    """
+    pool = getattr(bot, "sftp_pool", None)
+    if pool is None:
+        pool = bot.sftp_pool = SFTPClientPool()
+    return pool
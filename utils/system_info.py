@@ -12,6 +12,8 @@ import datetime
 import psutil
 from typing import Dict, Any, List, Optional
 
+from utils import _proc_fast
+
 # Configure logger
 logger = logging.getLogger("utils.system_info")
 
@@ -57,7 +59,7 @@ class SystemInfo:
             info = {
                 "cpu_count_physical": psutil.cpu_count(logical=False),
                 "cpu_count_logical": psutil.cpu_count(logical=True),
-                "cpu_usage_percent": psutil.cpu_percent(interval=0.5),
+                "cpu_usage_percent": SystemInfo._get_cpu_percent(),
                 "cpu_freq": None
             }
             
@@ -77,6 +79,23 @@ class SystemInfo:
             logger.error("Failed to get CPU information", exc_info=True)
             return {"error": "Failed to get CPU information"}
             
+    @staticmethod
+    def _get_cpu_percent() -> float:
+        """
+        Get CPU usage, using /proc/stat deltas on Linux to avoid sleeping
+        when a recent sample is available
+        
+        Returns:
+            float: CPU usage percentage
+        """
+        if _proc_fast.IS_LINUX:
+            try:
+                return _proc_fast.get_cpu_percent()
+            except (OSError, ValueError, IndexError):
+                pass
+                
+        return psutil.cpu_percent(interval=0.5)
+        
     @staticmethod
     def get_memory_info() -> Dict[str, Any]:
         """
@@ -86,6 +105,13 @@ class SystemInfo:
             Dict[str, Any]: Memory information
         """
         try:
+            # Read /proc/meminfo directly on Linux
+            if _proc_fast.IS_LINUX:
+                try:
+                    return _proc_fast.get_memory_info()
+                except OSError:
+                    pass
+
             # Get virtual memory
             vm = psutil.virtual_memory()
             
@@ -129,11 +155,12 @@ class SystemInfo:
             partition_info = []
             for partition in partitions:
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
+                    mountpoint = partition.mountpoint
+                    usage = psutil.disk_usage(mountpoint)
                     
                     partition_info.append({
                         "device": partition.device,
-                        "mountpoint": partition.mountpoint,
+                        "mountpoint": mountpoint,
                         "fstype": partition.fstype,
                         "opts": partition.opts,
                         "usage": {
@@ -241,6 +268,7 @@ class SystemInfo:
                 pid = os.getpid()
                 
             process = psutil.Process(pid)
+            memory_info = process.memory_info()
             
             # Get process information
             info = {
@@ -252,8 +280,8 @@ class SystemInfo:
                 "terminal": process.terminal(),
                 "cpu_percent": process.cpu_percent(interval=0.1),
                 "memory_info": {
-                    "rss": process.memory_info().rss,
-                    "vms": process.memory_info().vms
+                    "rss": memory_info.rss,
+                    "vms": memory_info.vms
                 },
                 "memory_percent": process.memory_percent(),
                 "num_threads": process.num_threads(),